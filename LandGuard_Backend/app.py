@@ -1,12 +1,30 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, g, has_request_context
 from flask_cors import CORS
-from fpdf import FPDF
+from flask_compress import Compress
+from flask.json.provider import DefaultJSONProvider
+from fpdf import FPDF, FPDF_VERSION
+from pypdf import PdfReader, PdfWriter
 import ee
+import numpy as np
+import orjson
 import datetime
 import os
 import math
 import json
+import re
 import base64
+import io
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, wraps
+import requests
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,35 +37,129 @@ GEE_SERVICE_ACCOUNT = os.getenv('GEE_SERVICE_ACCOUNT')
 GEE_PRIVATE_KEY = os.getenv('GEE_PRIVATE_KEY') # Expected as base64 string
 GEE_PROJECT = os.getenv('GEE_PROJECT', 'landguard-hackathon')
 
-try:
-    if GEE_SERVICE_ACCOUNT and GEE_PRIVATE_KEY:
-        # Load from environment variables (recommended for cloud hosting)
-        key_json = json.loads(base64.b64decode(GEE_PRIVATE_KEY).decode('utf-8'))
-        credentials = ee.ServiceAccountCredentials(GEE_SERVICE_ACCOUNT, key_data=key_json)
-        ee.Initialize(credentials, project=GEE_PROJECT)
-        print("✅ GEE Connected via Environment Variables.")
-    else:
-        # Fallback to local file
-        SERVICE_ACCOUNT_FILE = os.path.join(BASE_DIR, 'service-account.json')
-        SERVICE_ACCOUNT_EMAIL = 'landguard-bot@landguard-hackathon.iam.gserviceaccount.com'
-        credentials = ee.ServiceAccountCredentials(SERVICE_ACCOUNT_EMAIL, SERVICE_ACCOUNT_FILE)
-        ee.Initialize(credentials, project=GEE_PROJECT)
-        print("✅ GEE Connected via local service-account.json.")
-except Exception as e:
-    print(f"❌ GEE Auth Failed: {e}")
+def _gee_session():
+    """
+    requests.Session for Earth Engine traffic. earthengine-api already
+    reuses one session, but urllib3's default pool keeps only 10
+    connections, so bursts of concurrent getInfo() calls kept reopening
+    TLS connections. Also retries gateway errors with a short backoff
+    (429s are left to earthengine-api's own retry logic).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=['GET', 'POST']
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+_ee_initialized = False
+_ee_lock = threading.Lock()
+
+def _ensure_ee():
+    """
+    Initialize Earth Engine on first use rather than at import, so workers
+    boot instantly and a broken key doesn't take the whole app down.
+    Raises if authentication fails; the next call will retry.
+    """
+    global _ee_initialized
+    if _ee_initialized:
+        return
+    with _ee_lock:
+        if _ee_initialized:
+            return
+        try:
+            # ee.Initialize only creates its own session if none is set yet
+            ee.data._get_state().requests_session = _gee_session()
+            if GEE_SERVICE_ACCOUNT and GEE_PRIVATE_KEY:
+                # Load from environment variables (recommended for cloud hosting)
+                key_json = json.loads(base64.b64decode(GEE_PRIVATE_KEY).decode('utf-8'))
+                credentials = ee.ServiceAccountCredentials(GEE_SERVICE_ACCOUNT, key_data=key_json)
+                ee.Initialize(credentials, project=GEE_PROJECT)
+                print("✅ GEE Connected via Environment Variables.")
+            else:
+                # Fallback to local file
+                SERVICE_ACCOUNT_FILE = os.path.join(BASE_DIR, 'service-account.json')
+                SERVICE_ACCOUNT_EMAIL = 'landguard-bot@landguard-hackathon.iam.gserviceaccount.com'
+                credentials = ee.ServiceAccountCredentials(SERVICE_ACCOUNT_EMAIL, SERVICE_ACCOUNT_FILE)
+                ee.Initialize(credentials, project=GEE_PROJECT)
+                print("✅ GEE Connected via local service-account.json.")
+        except Exception as e:
+            print(f"❌ GEE Auth Failed: {e}")
+            raise
+        _ee_initialized = True
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    request.json / jsonify via orjson: the payloads are long coordinate
+    and timeline arrays, where it is several times faster than stdlib json.
+    Keys stay sorted to match Flask's default output.
+    """
+    _OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        option = self._OPTIONS | (orjson.OPT_INDENT_2 if kwargs.get('indent') else 0)
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Apache/lighttpd: let send_file() emit X-Sendfile instead of streaming
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE') == '1'
 
 # Configure CORS for production
 # In production, Replace '*' with the specific frontend URL for better security
 allowed_origins = os.getenv('ALLOWED_ORIGINS', '*').split(',')
-CORS(app, resources={r"/*": {"origins": allowed_origins}})
+CORS(app, resources={r"/*": {"origins": allowed_origins}},
+     expose_headers=['Content-Disposition'])  # filename of inline notices
+
+# Compress JSON only (PDFs are already deflated): brotli where the client
+# accepts it, gzip level 6 otherwise. Tiny bodies stay under COMPRESS_MIN_SIZE.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+Compress(app)
+
+# Pre-rendered by make_emblem.py; checked once instead of on every page
+EMBLEM_PATH = os.path.join(BASE_DIR, 'emblem.png')
+HAS_EMBLEM = os.path.exists(EMBLEM_PATH)
 
 # Create pdfs directory if it doesn't exist
 PDF_DIR = os.path.join(BASE_DIR, 'pdfs')
+# Devanagari fonts for the Hindi page. precompute_font.py writes a subset
+# holding only the glyphs the notice uses; it is preferred when present.
+FONT_DIR = os.path.join(BASE_DIR, 'fonts')
+HINDI_SUBSET = (os.path.join(FONT_DIR, 'hindi_subset.ttf'),
+                os.path.join(FONT_DIR, 'hindi_subset_bold.ttf'))
+HINDI_FONT_PAIRS = [
+    ('C:/Windows/Fonts/Nirmala.ttf', 'C:/Windows/Fonts/NirmalaB.ttf'),
+    ('C:/Windows/Fonts/Nirmala.ttc', 'C:/Windows/Fonts/Nirmala.ttc'),
+    ('C:/Windows/Fonts/mangal.ttf', 'C:/Windows/Fonts/mangalb.ttf'),
+]
+
+# Keep a copy of every notice under pdfs/ for /download; set ARCHIVE_PDFS=0
+# on stateless deployments that only serve notices inline
+ARCHIVE_PDFS = os.getenv('ARCHIVE_PDFS', '1') != '0'
+# Behind nginx, set PDF_ACCEL_PREFIX to an `internal` location aliased to
+# pdfs/ and /download hands the transfer off via X-Accel-Redirect
+PDF_ACCEL_PREFIX = os.getenv('PDF_ACCEL_PREFIX')
 if not os.path.exists(PDF_DIR):
     os.makedirs(PDF_DIR)
 
+# --- DETECTION THRESHOLDS ---
+# Shared by the Python verdicts and the server-side EE masks, so the
+# number a plot is judged by and the area it is mapped with never drift.
+NDVI_VACANT_THRESHOLD = 0.2    # mean NDVI above this: plot still vegetated
+VV_ENCROACHED_DB = -11.0       # mean VV backscatter above this: structure
+# A 30 m screening mean this close to a threshold is re-measured at 10 m
+NDVI_SCREEN_MARGIN = 0.05
+VV_SCREEN_MARGIN_DB = 1.0
+
 # --- AREA CALCULATION UTILITIES ---
 def haversine_distance(lat1, lon1, lat2, lon2):
     """Calculate distance between two points in kilometers"""
@@ -67,30 +179,24 @@ def calculate_polygon_area(coordinates):
     Uses the shoelace formula converted for geographic coordinates
     Returns area in square kilometers
     """
-    if not coordinates or len(coordinates) < 3:
+    if coordinates is None or len(coordinates) < 3:
         return 0
     
     # Earth's radius in km
     R = 6371
     
-    # Close the polygon if not already closed
-    coords = coordinates[:]
-    if coords[0] != coords[-1]:
-        coords.append(coords[0])
+    try:
+        coords = np.asarray(coordinates, dtype=np.float64)[:, :2]  # [lon, lat, altitude]
+    except ValueError:
+        coords = np.array([c[:2] for c in coordinates], dtype=np.float64)
+    lon = np.radians(coords[:, 0])
+    sin_lat = np.sin(np.radians(coords[:, 1]))
     
-    area = 0
-    for i in range(len(coords) - 1):
-        lon1, lat1 = coords[i][:2]  # [lon, lat, altitude]
-        lon2, lat2 = coords[i + 1][:2]
-        
-        lon1_rad = math.radians(lon1)
-        lat1_rad = math.radians(lat1)
-        lon2_rad = math.radians(lon2)
-        lat2_rad = math.radians(lat2)
-        
-        area += (lon2_rad - lon1_rad) * (2 + math.sin(lat1_rad) + math.sin(lat2_rad))
+    # Each edge runs to the next vertex; rolling closes the ring, and an
+    # already-closed ring just gains a zero-length edge.
+    area = np.dot(np.roll(lon, -1) - lon, 2 + sin_lat + np.roll(sin_lat, -1))
     
-    area = abs(area * R * R / 2.0)
+    area = abs(float(area) * R * R / 2.0)
     return area
 
 def calculate_excess_area(encroachment_score, total_area):
@@ -101,7 +207,7 @@ def calculate_excess_area(encroachment_score, total_area):
     """
     # If encroachment detected (score > threshold), estimate excess usage
     # Using a heuristic: higher encroachment = more excess area
-    encroachment_threshold = -11.0
+    encroachment_threshold = VV_ENCROACHED_DB
     
     if encroachment_score is None:
         return 0
@@ -115,58 +221,256 @@ def calculate_excess_area(encroachment_score, total_area):
     
     return 0
 
+# --- COORDINATE CLEANING ---
+def _clean_coords_py(c_list):
+    """[lon, lat] leaves of ragged nested coordinates, walked with a stack."""
+    if not isinstance(c_list[0], list):
+        return [c_list[0], c_list[1]]
+    root = [None] * len(c_list)
+    stack = [(c_list, root)]
+    while stack:
+        node, out = stack.pop()
+        for i, sub in enumerate(node):
+            if isinstance(sub[0], list):
+                out[i] = [None] * len(sub)
+                stack.append((sub, out[i]))
+            else:
+                out[i] = [sub[0], sub[1]]
+    return root
+
+def _clean_coords(coords):
+    """
+    Strip redundant single-element nesting from GeoJSON coordinates and
+    drop any altitude, leaving [lon, lat] leaves. Regular (non-ragged)
+    input is sliced in one go by NumPy; polygons whose rings differ in
+    length fall back to _clean_coords_py's explicit-stack walk.
+    """
+    try:
+        arr = np.asarray(coords, dtype=np.float64)
+    except ValueError:
+        temp_coords = coords
+        while isinstance(temp_coords, list) and len(temp_coords) == 1 and isinstance(temp_coords[0][0], list):
+            temp_coords = temp_coords[0]
+        return _clean_coords_py(temp_coords)
+    while arr.ndim > 2 and arr.shape[0] == 1:
+        arr = arr[0]
+    return arr[..., :2].tolist()
+
 # --- SATELLITE LOGIC ---
+def _date_window(days):
+    """
+    (start, end) covering the last `days` days, snapped to midnight so
+    every request on the same day sends EE the identical filterDate range
+    and hits its cache. The end is tomorrow's midnight, so today's passes
+    are still included.
+    """
+    end_date = datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1),
+                                         datetime.time())
+    return end_date - datetime.timedelta(days=days), end_date
+
+# Shared pool for fanning out independent, network-bound GEE round-trips.
+# Under gevent these are greenlets, so size it for the whole worker's
+# in-flight requests rather than for CPU cores (see gunicorn.conf.py).
+_ee_pool = ThreadPoolExecutor(max_workers=int(os.getenv('EE_POOL_WORKERS', '8')))
+
+def _s2_collection(geometry):
+    """Cloud-filtered Sentinel-2 red/NIR scenes over the plot, last 60 days."""
+    start_date, end_date = _date_window(60)
+    return ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED') \
+        .filterBounds(geometry) \
+        .filterDate(start_date, end_date) \
+        .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
+        .select(['B4', 'B8'])
+
+def _s1_collection(geometry):
+    """Sentinel-1 IW scenes with VV over the plot, last 30 days."""
+    start_date, end_date = _date_window(30)
+    return ee.ImageCollection('COPERNICUS/S1_GRD') \
+        .filterBounds(geometry) \
+        .filterDate(start_date, end_date) \
+        .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
+        .filter(ee.Filter.eq('instrumentMode', 'IW'))
+
+def _s2_composite(geometry):
+    """Sentinel-2 red/NIR median over the last 60 days, clipped to the plot."""
+    return _s2_collection(geometry).median().clip(geometry)
+
+def _despeckle(image):
+    """
+    3x3 focal median on VV. SAR speckle otherwise pushes single bright
+    pixels over the -11 dB threshold. The kernel is in pixels of whatever
+    grid EE evaluates at, so the 30 m screening pass filters just as
+    much as the 10 m refinement.
+    """
+    return image.select('VV').focal_median(radius=1, kernelType='square', units='pixels')
+
+def _s1_composite(geometry):
+    """Despeckled Sentinel-1 VV mean over the last 30 days, clipped to the plot."""
+    return _despeckle(_s1_collection(geometry).mean()).clip(geometry)
+
+def _region_mean(image, geometry, scale=10):
+    """
+    Per-band mean over the plot (10 m by default). bestEffort lets EE
+    coarsen the scale on very large polygons instead of failing on
+    maxPixels, and tileScale=4 keeps per-tile memory low.
+    """
+    return image.reduceRegion(
+        reducer=ee.Reducer.mean(),
+        geometry=geometry,
+        scale=scale,
+        maxPixels=1e9,
+        bestEffort=True,
+        tileScale=4
+    )
+
+# Plots above this area are reduced as a grid of tiles mapped in parallel
+TILED_PLOT_SQM = 2e6
+TILE_SIZE_M = 1000
+
+def _band_mean(image, band, geometry, scale):
+    """
+    Lazy mean of one band. Large plots are split with coveringGrid and
+    each tile reduced by its own map() call, so EE spreads them across
+    workers; per-tile sums and counts recombine into the exact pixel mean.
+    """
+    plain = _region_mean(image, geometry, scale).get(band)
+    reducer = ee.Reducer.sum().combine(ee.Reducer.count(), sharedInputs=True)
+    tiles = geometry.coveringGrid(ee.Projection('EPSG:3857'), TILE_SIZE_M).map(
+        lambda tile: tile.set(image.select([band]).reduceRegion(
+            reducer=reducer,
+            geometry=tile.geometry(),  # image is already clipped to the plot
+            scale=scale,
+            maxPixels=1e9,
+            bestEffort=True,
+            tileScale=4
+        )))
+    count = ee.Number(tiles.aggregate_sum(band + '_count'))
+    tiled = ee.Algorithms.If(count.gt(0),
+                             ee.Number(tiles.aggregate_sum(band + '_sum')).divide(count), None)
+    return ee.Algorithms.If(geometry.area(10).gt(TILED_PLOT_SQM), tiled, plain)
+
+def _screened_mean(image, band, geometry, threshold, margin):
+    """
+    Lazy mean of `band`, screened at 30 m (9x fewer pixels). The native
+    10 m reduction only runs when the coarse value is missing (plot
+    smaller than a pixel) or within `margin` of the threshold, where
+    resolution could flip the verdict. ee.Algorithms.If only evaluates
+    the branch it takes, so this is still one round-trip.
+    """
+    coarse = _band_mean(image, band, geometry, 30)
+    fine = _band_mean(image, band, geometry, 10)
+    near = ee.Number(coarse).subtract(threshold).abs().lt(margin)
+    return ee.Algorithms.If(
+        ee.Algorithms.IsEqual(coarse, None), fine,
+        ee.Algorithms.If(near, fine, coarse))
+
+def _ndvi_mean(ndvi, geometry):
+    return _screened_mean(ndvi, 'NDVI', geometry, NDVI_VACANT_THRESHOLD, NDVI_SCREEN_MARGIN)
+
+def _vv_mean(vv, geometry):
+    return _screened_mean(vv, 'VV', geometry, VV_ENCROACHED_DB, VV_SCREEN_MARGIN_DB)
+
+def _vegetation_result(val):
+    if val is not None:
+        is_vacant = val > NDVI_VACANT_THRESHOLD
+        return {
+            "status": "Vegetated" if is_vacant else "Vegetation Loss Detected",
+            "score": round(val, 4),
+            "is_vacant": is_vacant
+        }
+    return {"status": "No Data", "score": 0, "is_vacant": False}
+
+def _encroachment_result(val):
+    if val is not None:
+        is_encroached = val > VV_ENCROACHED_DB
+        return {
+            "status": "Encroachment Confirmed" if is_encroached else "Clear",
+            "score": round(val, 4),
+            "is_encroached": is_encroached
+        }
+    return {"status": "No Data", "score": 0, "is_encroached": False}
+
 def check_vegetation(geometry):
     try:
-        end_date = datetime.datetime.now()
-        start_date = end_date - datetime.timedelta(days=60)
-        s2 = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED') \
-            .filterBounds(geometry) \
-            .filterDate(start_date, end_date) \
-            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)) \
-            .median().clip(geometry)
-        
-        ndvi = s2.normalizedDifference(['B8', 'B4']).rename('NDVI')
-        val = ndvi.reduceRegion(ee.Reducer.mean(), geometry, 10).get('NDVI').getInfo()
-        
-        if val is not None:
-            is_vacant = val > 0.2 
-            return {
-                "status": "Vegetated" if is_vacant else "Vegetation Loss Detected",
-                "score": round(val, 4),
-                "is_vacant": is_vacant
-            }
-        return {"status": "No Data", "score": 0, "is_vacant": False}
+        _ensure_ee()
+        ndvi = _s2_composite(geometry).normalizedDifference(['B8', 'B4']).rename('NDVI')
+        val = _ndvi_mean(ndvi, geometry).getInfo()
+        return _vegetation_result(val)
     except Exception:
         return {"status": "Analysis Error", "score": 0, "is_vacant": False}
 
 def check_encroachment(geometry):
     try:
-        end_date = datetime.datetime.now()
-        start_date = end_date - datetime.timedelta(days=30)
-        s1 = ee.ImageCollection('COPERNICUS/S1_GRD') \
-            .filterBounds(geometry) \
-            .filterDate(start_date, end_date) \
-            .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
-            .filter(ee.Filter.eq('instrumentMode', 'IW')) \
-            .mean().clip(geometry)
-        
-        val = s1.select('VV').reduceRegion(ee.Reducer.mean(), geometry, 10).get('VV').getInfo()
-
-        limit = -11.0 
-        if val is not None:
-            is_encroached = val > limit
-            return {
-                "status": "Encroachment Confirmed" if is_encroached else "Clear",
-                "score": round(val, 4),
-                "is_encroached": is_encroached
-            }
-        return {"status": "No Data", "score": 0, "is_encroached": False}
+        _ensure_ee()
+        s1 = _s1_composite(geometry)
+        val = _vv_mean(s1.select('VV'), geometry).getInfo()
+        return _encroachment_result(val)
     except Exception:
         return {"status": "Analysis Error", "score": 0, "is_encroached": False}
 
+def _sensor_means(geometry):
+    """
+    Lazy ee.Dictionary with the plot's mean 'NDVI' and 'VV'. Each sensor
+    is guarded server-side, so a window with no scene for one of them
+    yields None for that key instead of failing the whole request.
+    """
+    s2 = _s2_collection(geometry)
+    s1 = _s1_collection(geometry)
+    ndvi = s2.median().clip(geometry).normalizedDifference(['B8', 'B4']).rename('NDVI')
+    vv = _s1_composite(geometry)
+    return ee.Dictionary({
+        'NDVI': ee.Algorithms.If(s2.size().gt(0), _ndvi_mean(ndvi, geometry), None),
+        'VV': ee.Algorithms.If(s1.size().gt(0), _vv_mean(vv, geometry), None)
+    })
+
+def check_plot(geometry):
+    """
+    Run both sensor checks in a single getInfo() on _sensor_means, i.e.
+    one GEE round-trip instead of two.
+    Returns (vegetation_result, encroachment_result).
+    A sensor with no scene in its window comes back as 'No Data'; the
+    separate checks remain as a fallback for any other failure.
+    """
+    try:
+        _ensure_ee()
+        means = _sensor_means(geometry).getInfo()
+        return _vegetation_result(means.get('NDVI')), _encroachment_result(means.get('VV'))
+    except Exception:
+        # The two checks are independent; overlap their round-trips
+        vegetation = _ee_pool.submit(check_vegetation, geometry)
+        encroachment = _ee_pool.submit(check_encroachment, geometry)
+        return vegetation.result(), encroachment.result()
+
 # --- THE HAMMER: CLEAN B&W LEGAL NOTICE PDF GENERATOR ---
 
+# Emoji / pictograph ranges stripped from user-supplied notice fields
+_EMOJI_RE = re.compile(
+    r'[\U00002600-\U000027BF'
+    r'\U0000FE00-\U0000FE0F'
+    r'\U0001F000-\U0001FFFF'
+    r'\U00002702-\U000027B0'
+    r'\U00002190-\U000021FF'
+    r'\U00002300-\U000023FF'
+    r'\U00002B50-\U00002B55'
+    r'\U0000200D'
+    r'\U0000FE0F]+')
+
+
+class _Latin1Table(dict):
+    """
+    str.translate table for the core (latin-1) PDF fonts.
+    Latin-1 codepoints map to themselves; anything else becomes '?',
+    same as encode('latin-1', errors='replace') without the round-trip.
+    """
+
+    def __missing__(self, codepoint):
+        self[codepoint] = '?'
+        return '?'
+
+
+_LATIN1_TABLE = _Latin1Table((c, c) for c in range(0x100))
+
+
 class GazettePDF(FPDF):
     """
     Clean black-and-white legal notice PDF.
@@ -178,13 +482,13 @@ class GazettePDF(FPDF):
         super().__init__()
         self._hindi = False
         self._is_hindi_page = False
+        # Page numbers count from here, so a batch (see _notice_batch)
+        # numbers each of its notices from 1
+        self._first_page = 1
+        # (filename, first_page, last_page) per notice drawn into a batch
+        self._notices = []
         # Load Devanagari font
-        font_pairs = [
-            ('C:/Windows/Fonts/Nirmala.ttf', 'C:/Windows/Fonts/NirmalaB.ttf'),
-            ('C:/Windows/Fonts/Nirmala.ttc', 'C:/Windows/Fonts/Nirmala.ttc'),
-            ('C:/Windows/Fonts/mangal.ttf', 'C:/Windows/Fonts/mangalb.ttf'),
-        ]
-        for reg, bold in font_pairs:
+        for reg, bold in [HINDI_SUBSET] + HINDI_FONT_PAIRS:
             if os.path.exists(reg):
                 try:
                     self.add_font('Hindi', '', reg)
@@ -214,6 +518,64 @@ class GazettePDF(FPDF):
         self.line(10, y + 2.5, 200, y + 2.5)
         self.set_y(y + 5)
 
+    def _table(self, col_w, header, rows, align, body_size, fill_first=True):
+        """
+        Bordered table: black header row, then body rows with alternating
+        light-grey fill. Font and colour state is set once per table.
+        """
+        last = len(col_w) - 1
+        self.set_font('Times', 'B', 8)
+        self.set_fill_color(0, 0, 0)
+        self.set_text_color(255, 255, 255)
+        for j, text in enumerate(header):
+            self.cell(col_w[j], 5.5, f' {text}', 1, 1 if j == last else 0, align[j], fill=True)
+        self.set_text_color(0, 0, 0)
+        self.set_font('Times', '', body_size)
+        self.set_fill_color(235, 235, 235)
+        for i, row in enumerate(rows):
+            fill = (i % 2 == 0) == fill_first
+            for j, text in enumerate(row):
+                self.cell(col_w[j], 5, f' {text}', 1, 1 if j == last else 0, align[j], fill=fill)
+
+    def _hindi_block(self, h, text, style='', size=9):
+        """
+        Left-aligned Devanagari paragraph block. Line breaks come from
+        _hindi_lines, so recurring boilerplate is only measured once.
+        """
+        self.set_font('Hindi', style, size)
+        width = self.w - self.r_margin - self.x - 2 * self.c_margin
+        for para in text.split('\n'):
+            for line in _hindi_lines(para, width, style, size):
+                self.cell(0, h, line, 0, 1, 'L')
+
+    def _signature(self, family, by_order, signatory, dept):
+        """Right-hand signature block: 'By Order', signatory, department."""
+        col_x = self.l_margin + 100
+        self.set_font(family, '', 9)
+        self.set_x(col_x)
+        self.cell(90, 5, by_order, 0, 1, 'L')
+        self.ln(6)
+        self.set_x(col_x)
+        self.set_font(family, 'B', 9)
+        self.cell(90, 5, signatory, 0, 1, 'L')
+        self.set_x(col_x)
+        self.set_font(family, '', 8)
+        self.cell(90, 4, dept, 0, 1, 'L')
+
+    # Masthead lines (style, size, height, text); identical on every page
+    _MASTHEAD_EN = (
+        ('B', 14, 7, 'CHHATTISGARH RAJPATRA'),
+        ('', 9, 5, '(Extraordinary) - Published by Authority'),
+        ('B', 11, 6, 'Revenue & Land Estate Management Department'),
+        ('', 9, 5, 'Chhattisgarh State Industrial Development Corporation (CSIDC)'),
+    )
+    _MASTHEAD_HI = (
+        ('B', 14, 7, '\u091b\u0924\u094d\u0924\u0940\u0938\u0917\u0922\u093c \u0930\u093e\u091c\u092a\u0924\u094d\u0930'),
+        ('', 9, 5, '(\u0905\u0938\u093e\u0927\u093e\u0930\u0923) - \u092a\u094d\u0930\u093e\u0927\u093f\u0915\u093e\u0930 \u0938\u0947 \u092a\u094d\u0930\u0915\u093e\u0936\u093f\u0924'),
+        ('B', 11, 6, '\u0930\u093e\u091c\u0938\u094d\u0935 \u090f\u0935\u0902 \u092d\u0942-\u0938\u0902\u092a\u0926\u093e \u092a\u094d\u0930\u092c\u0902\u0927\u0928 \u0935\u093f\u092d\u093e\u0917'),
+        ('', 9, 5, '\u091b\u0924\u094d\u0924\u0940\u0938\u0917\u0922\u093c \u0930\u093e\u091c\u094d\u092f \u0914\u0926\u094d\u092f\u094b\u0917\u093f\u0915 \u0935\u093f\u0915\u093e\u0938 \u0928\u093f\u0917\u092e (CSIDC)'),
+    )
+
     # ── Page Header ──
     def header(self):
         self.set_text_color(0, 0, 0)
@@ -223,32 +585,20 @@ class GazettePDF(FPDF):
         self.set_y(start_y)
 
         # Emblem (centred, small)
-        emblem_path = os.path.join(os.path.dirname(__file__), 'emblem.png')
         emblem_w = 18
-        if os.path.exists(emblem_path):
-            self.image(emblem_path, x=(210 - emblem_w) / 2, y=start_y, w=emblem_w)
+        if HAS_EMBLEM:
+            self.image(EMBLEM_PATH, x=(210 - emblem_w) / 2, y=start_y, w=emblem_w)
             self.set_y(start_y + emblem_w + 2)
         else:
             self.set_y(start_y)
 
         if self._is_hindi_page and self._hindi:
-            self.set_font('Hindi', 'B', 14)
-            self.cell(0, 7, '\u091b\u0924\u094d\u0924\u0940\u0938\u0917\u0922\u093c \u0930\u093e\u091c\u092a\u0924\u094d\u0930', 0, 1, 'C')
-            self.set_font('Hindi', '', 9)
-            self.cell(0, 5, '(\u0905\u0938\u093e\u0927\u093e\u0930\u0923) - \u092a\u094d\u0930\u093e\u0927\u093f\u0915\u093e\u0930 \u0938\u0947 \u092a\u094d\u0930\u0915\u093e\u0936\u093f\u0924', 0, 1, 'C')
-            self.set_font('Hindi', 'B', 11)
-            self.cell(0, 6, '\u0930\u093e\u091c\u0938\u094d\u0935 \u090f\u0935\u0902 \u092d\u0942-\u0938\u0902\u092a\u0926\u093e \u092a\u094d\u0930\u092c\u0902\u0927\u0928 \u0935\u093f\u092d\u093e\u0917', 0, 1, 'C')
-            self.set_font('Hindi', '', 9)
-            self.cell(0, 5, '\u091b\u0924\u094d\u0924\u0940\u0938\u0917\u0922\u093c \u0930\u093e\u091c\u094d\u092f \u0914\u0926\u094d\u092f\u094b\u0917\u093f\u0915 \u0935\u093f\u0915\u093e\u0938 \u0928\u093f\u0917\u092e (CSIDC)', 0, 1, 'C')
+            family, lines = 'Hindi', self._MASTHEAD_HI
         else:
-            self.set_font('Times', 'B', 14)
-            self.cell(0, 7, 'CHHATTISGARH RAJPATRA', 0, 1, 'C')
-            self.set_font('Times', '', 9)
-            self.cell(0, 5, '(Extraordinary) - Published by Authority', 0, 1, 'C')
-            self.set_font('Times', 'B', 11)
-            self.cell(0, 6, 'Revenue & Land Estate Management Department', 0, 1, 'C')
-            self.set_font('Times', '', 9)
-            self.cell(0, 5, 'Chhattisgarh State Industrial Development Corporation (CSIDC)', 0, 1, 'C')
+            family, lines = 'Times', self._MASTHEAD_EN
+        for style, size, h, text in lines:
+            self.set_font(family, style, size)
+            self.cell(0, h, text, 0, 1, 'C')
 
         self.ln(1)
         self._thick_line()
@@ -263,42 +613,111 @@ class GazettePDF(FPDF):
         self.cell(0, 3, 'Computer-generated document | CG Land Revenue Code & Town and Country Planning Act', 0, 1, 'C')
         self.cell(0, 3, 'UdyogGadh AI Satellite Surveillance | Copernicus Sentinel-1 / Sentinel-2', 0, 1, 'C')
         self.set_font('Times', '', 7)
-        self.cell(0, 3, f'Page {self.page_no()}/{{nb}}', 0, 0, 'C')
+        self.cell(0, 3, f'Page {self.page_no() - self._first_page + 1}/{{nb}}', 0, 0, 'C')
         self.set_text_color(0, 0, 0)
 
 
+# Static notice boilerplate, built once at import; only the total in
+# directive 2 is filled in per notice
+DIRECTIVES_EN = (
+    '1. Immediately cease all unauthorized construction and land-use activities.\n'
+    '2. Deposit Rs. {total}/- within 15 days.\n'
+    '3. Restore land to designated industrial use or face summary eviction.\n'
+    '4. Appear before Revenue Court / Tahsildar on the scheduled hearing date.\n'
+    '5. Produce allotment documents, building permissions, and land records.'
+)
+
+WARNING_EN = (
+    'WARNING: Non-compliance within 15 days shall result in: (a) Demolition of unauthorized '
+    'structures at your cost, (b) Recovery of dues as arrears of land revenue, '
+    '(c) Cancellation of plot allotment, (d) Criminal prosecution under applicable CG laws.'
+)
+
+DIRECTIVES_HI = (
+    '1. \u0938\u092d\u0940 \u0905\u0928\u0927\u093f\u0915\u0943\u0924 \u0928\u093f\u0930\u094d\u092e\u093e\u0923 \u090f\u0935\u0902 \u092d\u0942\u092e\u093f \u0909\u092a\u092f\u094b\u0917 \u0917\u0924\u093f\u0935\u093f\u0927\u093f\u092f\u093e\u0902 \u0924\u0941\u0930\u0902\u0924 \u092c\u0902\u0926 \u0915\u0930\u0947\u0902\u0964\n'
+    '2. Rs. {total}/- 15 \u0926\u093f\u0928\u094b\u0902 \u092e\u0947\u0902 \u091c\u092e\u093e \u0915\u0930\u0947\u0902\u0964\n'
+    '3. \u092d\u0942\u092e\u093f \u0915\u094b \u0928\u093f\u0930\u094d\u0927\u093e\u0930\u093f\u0924 \u0914\u0926\u094d\u092f\u094b\u0917\u093f\u0915 \u0909\u092a\u092f\u094b\u0917 \u092e\u0947\u0902 \u092a\u0941\u0928\u0903\u0938\u094d\u0925\u093e\u092a\u093f\u0924 \u0915\u0930\u0947\u0902\u0964\n'
+    '4. \u0928\u093f\u0930\u094d\u0927\u093e\u0930\u093f\u0924 \u0938\u0941\u0928\u0935\u093e\u0908 \u0924\u093f\u0925\u093f \u092a\u0930 \u0930\u093e\u091c\u0938\u094d\u0935 \u0928\u094d\u092f\u093e\u092f\u093e\u0932\u092f / \u0924\u0939\u0938\u0940\u0932\u0926\u093e\u0930 \u0915\u0947 \u0938\u092e\u0915\u094d\u0937 \u0909\u092a\u0938\u094d\u0925\u093f\u0924 \u0939\u094b\u0902\u0964\n'
+    '5. \u0938\u092d\u0940 \u0906\u0935\u0902\u091f\u0928 \u0926\u0938\u094d\u0924\u093e\u0935\u0947\u091c\u093c, \u092d\u0935\u0928 \u0905\u0928\u0941\u092e\u0924\u093f \u090f\u0935\u0902 \u092d\u0942\u092e\u093f \u0905\u092d\u093f\u0932\u0947\u0916 \u092a\u094d\u0930\u0938\u094d\u0924\u0941\u0924 \u0915\u0930\u0947\u0902\u0964'
+)
+
+WARNING_HI = (
+    '\u091a\u0947\u0924\u093e\u0935\u0928\u0940: 15 \u0926\u093f\u0928\u094b\u0902 \u092e\u0947\u0902 \u0905\u0928\u0941\u092a\u093e\u0932\u0928 \u0928 \u0915\u0930\u0928\u0947 \u092a\u0930: (\u0915) \u0906\u092a\u0915\u0940 \u0932\u093e\u0917\u0924 \u092a\u0930 \u0905\u0928\u0927\u093f\u0915\u0943\u0924 \u0928\u093f\u0930\u094d\u092e\u093e\u0923 \u0927\u094d\u0935\u0938\u094d\u0924\u0940\u0915\u0930\u0923, '
+    '(\u0916) \u092d\u0942-\u0930\u093e\u091c\u0938\u094d\u0935 \u092c\u0915\u093e\u092f\u093e \u0915\u0947 \u0930\u0942\u092a \u092e\u0947\u0902 \u0935\u0938\u0942\u0932\u0940, '
+    '(\u0917) \u092a\u094d\u0932\u0949\u091f \u0906\u0935\u0902\u091f\u0928 \u0930\u0926\u094d\u0926, (\u0918) \u0932\u093e\u0917\u0942 \u0915\u093e\u0928\u0942\u0928\u094b\u0902 \u0915\u0947 \u0924\u0939\u0924 \u0906\u092a\u0930\u093e\u0927\u093f\u0915 \u0905\u092d\u093f\u092f\u094b\u091c\u0928\u0964'
+)
+
+_hindi_measure_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _hindi_measure_pdf():
+    pdf = GazettePDF()
+    pdf.add_page()
+    return pdf
+
+@lru_cache(maxsize=256)
+def _hindi_lines(text, width, style, size):
+    """Greedy word-wrap of one Hindi paragraph to `width` mm, measured once."""
+    if not text:
+        return ('',)
+    with _hindi_measure_lock:
+        pdf = _hindi_measure_pdf()
+        pdf.set_font('Hindi', style, size)
+        lines, cur = [], ''
+        for word in text.split(' '):
+            trial = f'{cur} {word}' if cur else word
+            if cur and pdf.get_string_width(trial) > width:
+                lines.append(cur)
+                cur = word
+            else:
+                cur = trial
+        lines.append(cur)
+    return tuple(lines)
+
+
 def create_notice(plot_id, violation_type, excess_area_sqm=0,
                   ndvi_score=None, ndvi_status=None,
                   radar_score=None, radar_status=None,
                   confidence_score=None,
                   total_area_sqm=None, utilization_ratio=None,
-                  timeline_data=None):
+                  timeline_data=None, as_bytes=False, batch=None):
     """
     Generate a clean B&W legal notice.  Page 1 = English.  Page 2 = Hindi.
     4 sections: WHY | DURATION | TECHNICAL BASIS | AMOUNT PAYABLE
+    Returns the filename, or (filename, pdf_bytes) when as_bytes is set.
+    With a `batch` GazettePDF the pages are appended to it instead and
+    (filename, None) is returned; _notice_batch fills in the bytes.
     """
-    import re as _re
-
     def safe(text):
         if not text:
             return ''
-        text = str(text)
-        text = _re.sub(
-            r'[\U00002600-\U000027BF'
-            r'\U0000FE00-\U0000FE0F'
-            r'\U0001F000-\U0001FFFF'
-            r'\U00002702-\U000027B0'
-            r'\U00002190-\U000021FF'
-            r'\U00002300-\U000023FF'
-            r'\U00002B50-\U00002B55'
-            r'\U0000200D'
-            r'\U0000FE0F]+', '', text)
-        text = text.encode('latin-1', errors='replace').decode('latin-1')
+        text = _EMOJI_RE.sub('', str(text))
+        text = text.translate(_LATIN1_TABLE)
         return text.strip()
 
     violation_type = safe(violation_type)
     plot_id = safe(plot_id)
 
+    now = datetime.datetime.now()
+    date_str = now.strftime("%d %B %Y")
+    date_short = now.strftime("%Y%m%d")
+
+    # Same inputs on the same day render the same notice; reuse it if on disk
+    cache_key = hashlib.sha1(json.dumps([
+        plot_id, violation_type, excess_area_sqm, ndvi_score, ndvi_status,
+        radar_score, radar_status, confidence_score, total_area_sqm,
+        utilization_ratio, timeline_data, date_short,
+    ], sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    # Only [A-Za-z0-9_-] of the plot ID goes into the filename (see _NOTICE_NAME_RE)
+    file_id = re.sub(r'[^\w-]', '_', plot_id, flags=re.ASCII)[:64]
+    filename = f"NOTICE_{file_id}_{date_short}_{cache_key}.pdf"
+    filepath = os.path.join(PDF_DIR, filename)
+    if os.path.exists(filepath):
+        if as_bytes:
+            with open(filepath, 'rb') as f:
+                return filename, f.read()
+        return filename
+
     # ── Numerical values ──
     try:
         area_excess_sqm = float(excess_area_sqm)
@@ -324,8 +743,8 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     conf_display = f'{conf_pct}%' if conf_pct is not None else 'N/A'
     util_display = f'{util_val}%' if util_val is not None else 'N/A'
 
-    ndvi_violating = ndvi_val is not None and ndvi_val < 0.2
-    radar_violating = radar_val is not None and radar_val > -11.0
+    ndvi_violating = ndvi_val is not None and ndvi_val < NDVI_VACANT_THRESHOLD
+    radar_violating = radar_val is not None and radar_val > VV_ENCROACHED_DB
 
     if ndvi_violating and radar_violating:
         primary_en = 'Both NDVI (vegetation loss) and VV Radar (structural encroachment)'
@@ -349,13 +768,26 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     min_area = 0
     max_area = 0
     if timeline_data and len(timeline_data) > 0:
-        violating_dates = [t for t in timeline_data if t.get('encroached_area', 0) > 0]
-        if violating_dates:
-            violating_dates.sort(key=lambda x: x['date'])
-            first_detected_date = violating_dates[0]['date']
-            last_date_str = violating_dates[-1]['date']
-            min_area = min(t['encroached_area'] for t in violating_dates)
-            max_area = max(t['encroached_area'] for t in violating_dates)
+        # Single pass: earliest/latest violating date and area range
+        min_area = float('inf')
+        max_area = float('-inf')
+        for t in timeline_data:
+            area = t.get('encroached_area', 0)
+            if area <= 0:
+                continue
+            d = t['date']
+            if first_detected_date is None or d < first_detected_date:
+                first_detected_date = d
+            if last_date_str is None or d >= last_date_str:
+                last_date_str = d
+            if area < min_area:
+                min_area = area
+            if area > max_area:
+                max_area = area
+        if first_detected_date is None:
+            min_area = 0
+            max_area = 0
+        else:
             try:
                 d1 = datetime.datetime.strptime(first_detected_date, '%Y-%m-%d')
                 d2 = datetime.datetime.strptime(last_date_str, '%Y-%m-%d')
@@ -382,12 +814,13 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     total_liability = fine_statutory + civil_liability + duration_penalty
 
     # ── Create PDF ──
-    pdf = GazettePDF()
-    pdf.alias_nb_pages()
+    if batch is None:
+        pdf = GazettePDF()
+        pdf.alias_nb_pages()
+    else:
+        pdf = batch
     pdf.set_auto_page_break(auto=True, margin=22)
 
-    date_str = datetime.datetime.now().strftime("%d %B %Y")
-    date_short = datetime.datetime.now().strftime("%Y%m%d")
     ref_no = f"CSIDC/TCP/LG-{date_short}/{plot_id}"
     notice_number = f'{abs(hash(plot_id)) % 9000 + 1000}'
 
@@ -396,6 +829,7 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     # ══════════════════════════════════════════════════════════════
     pdf._is_hindi_page = False
     pdf.add_page()
+    pdf._first_page = pdf.page  # after add_page(): the last footer is the previous notice's
 
     # Ref & date
     pdf.set_font('Times', 'B', 9)
@@ -494,7 +928,7 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     ndvi_meaning = ('Vegetation loss detected - consistent with construction/paving.' if ndvi_violating
                     else 'Normal vegetation within acceptable limits.')
     pdf.multi_cell(0, 4,
-        f'    Score: {ndvi_display}  |  Threshold: 0.20  |  Status: {ndvi_flag} threshold\n'
+        f'    Score: {ndvi_display}  |  Threshold: {NDVI_VACANT_THRESHOLD:.2f}  |  Status: {ndvi_flag} threshold\n'
         f'    Interpretation: {ndvi_meaning}  |  Assessment: {ndvi_str}'
     )
     pdf.ln(1)
@@ -507,21 +941,12 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     radar_meaning = ('Hard structures (concrete/metal/brick) detected beyond sanctioned area.' if radar_violating
                      else 'No significant structural anomalies.')
     pdf.multi_cell(0, 4,
-        f'    Score: {radar_display}  |  Threshold: -11.0 dB  |  Status: {radar_flag} threshold\n'
+        f'    Score: {radar_display}  |  Threshold: {VV_ENCROACHED_DB:.1f} dB  |  Status: {radar_flag} threshold\n'
         f'    Interpretation: {radar_meaning}  |  Assessment: {radar_str}'
     )
     pdf.ln(1)
 
     # Evidence summary table
-    pdf.set_font('Times', 'B', 8)
-    col_w = [47, 47, 47, 49]
-    pdf.set_fill_color(0, 0, 0)
-    pdf.set_text_color(255, 255, 255)
-    for j, hdr in enumerate(['Parameter', 'Source', 'Value', 'Finding']):
-        pdf.cell(col_w[j], 5.5, f' {hdr}', 1, 0, 'L', fill=True)
-    pdf.ln()
-    pdf.set_text_color(0, 0, 0)
-    pdf.set_font('Times', '', 8)
     conf_label = 'HIGH' if (conf_pct and conf_pct > 80) else 'MODERATE'
     rows = [
         ('NDVI Score', 'Sentinel-2 MSI', ndvi_display, 'VIOLATING' if ndvi_violating else 'Normal'),
@@ -529,13 +954,8 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
         ('AI Confidence', 'Multi-Sensor', conf_display, conf_label),
         ('Excess Area', 'GIS Boundary', f'{area_excess_sqm:.1f} m2', f'{util_display} of plot'),
     ]
-    for i, (p, s, v, f_) in enumerate(rows):
-        fill = i % 2 == 0
-        pdf.set_fill_color(235, 235, 235)
-        pdf.cell(col_w[0], 5, f' {p}', 1, 0, 'L', fill=fill)
-        pdf.cell(col_w[1], 5, f' {s}', 1, 0, 'L', fill=fill)
-        pdf.cell(col_w[2], 5, f' {v}', 1, 0, 'L', fill=fill)
-        pdf.cell(col_w[3], 5, f' {f_}', 1, 1, 'L', fill=fill)
+    pdf._table([47, 47, 47, 49], ('Parameter', 'Source', 'Value', 'Finding'), rows,
+               align='LLLL', body_size=8)
     pdf.ln(2)
 
     # ── SECTION 4: AMOUNT PAYABLE ──
@@ -551,28 +971,15 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
 
     # Financial table
     fin_w = [85, 45, 60]
-    pdf.set_font('Times', 'B', 8)
-    pdf.set_fill_color(0, 0, 0)
-    pdf.set_text_color(255, 255, 255)
-    pdf.cell(fin_w[0], 5.5, ' Description', 1, 0, 'L', fill=True)
-    pdf.cell(fin_w[1], 5.5, ' Reference', 1, 0, 'L', fill=True)
-    pdf.cell(fin_w[2], 5.5, ' Amount (INR)', 1, 1, 'R', fill=True)
-    pdf.set_text_color(0, 0, 0)
-    pdf.set_font('Times', '', 8.5)
-
-    pdf.set_fill_color(235, 235, 235)
-    pdf.cell(fin_w[0], 5, ' Statutory Penalty', 1, 0, 'L')
-    pdf.cell(fin_w[1], 5, ' Sec 248, CG LRC', 1, 0, 'L')
-    pdf.cell(fin_w[2], 5, f' Rs. {fine_statutory:,}', 1, 1, 'R')
-
-    pdf.cell(fin_w[0], 5, f' Land Recovery ({area_excess_sqm:.1f} m2 @ Rs.{LAND_RATE_PER_SQFT}/sqft)', 1, 0, 'L', fill=True)
-    pdf.cell(fin_w[1], 5, ' Civil Damages', 1, 0, 'L', fill=True)
-    pdf.cell(fin_w[2], 5, f' Rs. {civil_liability:,}', 1, 1, 'R', fill=True)
-
+    fin_rows = [
+        ('Statutory Penalty', 'Sec 248, CG LRC', f'Rs. {fine_statutory:,}'),
+        (f'Land Recovery ({area_excess_sqm:.1f} m2 @ Rs.{LAND_RATE_PER_SQFT}/sqft)', 'Civil Damages', f'Rs. {civil_liability:,}'),
+    ]
     if duration_penalty > 0:
-        pdf.cell(fin_w[0], 5, f' Duration Surcharge ({months_violating} mo @ Rs.{monthly_penalty_rate:,}/mo)', 1, 0, 'L')
-        pdf.cell(fin_w[1], 5, ' Ongoing violation', 1, 0, 'L')
-        pdf.cell(fin_w[2], 5, f' Rs. {duration_penalty:,}', 1, 1, 'R')
+        fin_rows.append((f'Duration Surcharge ({months_violating} mo @ Rs.{monthly_penalty_rate:,}/mo)',
+                         'Ongoing violation', f'Rs. {duration_penalty:,}'))
+    pdf._table(fin_w, ('Description', 'Reference', 'Amount (INR)'), fin_rows,
+               align='LLR', body_size=8.5, fill_first=False)
 
     pdf.set_font('Times', 'B', 9)
     pdf.set_fill_color(0, 0, 0)
@@ -593,35 +1000,17 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
     pdf.set_font('Times', 'B', 9)
     pdf.cell(0, 5, 'DIRECTIVES:', 0, 1, 'L')
     pdf.set_font('Times', '', 8.5)
-    pdf.multi_cell(0, 4.5,
-        '1. Immediately cease all unauthorized construction and land-use activities.\n'
-        f'2. Deposit Rs. {total_liability:,}/- within 15 days.\n'
-        '3. Restore land to designated industrial use or face summary eviction.\n'
-        '4. Appear before Revenue Court / Tahsildar on the scheduled hearing date.\n'
-        '5. Produce allotment documents, building permissions, and land records.'
-    )
+    pdf.multi_cell(0, 4.5, DIRECTIVES_EN.format(total=f'{total_liability:,}'))
     pdf.ln(1)
 
     # Warning
     pdf.set_font('Times', 'B', 8)
-    pdf.multi_cell(0, 4,
-        'WARNING: Non-compliance within 15 days shall result in: (a) Demolition of unauthorized '
-        'structures at your cost, (b) Recovery of dues as arrears of land revenue, '
-        '(c) Cancellation of plot allotment, (d) Criminal prosecution under applicable CG laws.'
-    )
+    pdf.multi_cell(0, 4, WARNING_EN)
     pdf.ln(3)
 
     # Signature
-    pdf.set_font('Times', '', 9)
-    pdf.cell(100, 5, '', 0, 0)
-    pdf.cell(90, 5, 'By Order,', 0, 1, 'L')
-    pdf.ln(6)
-    pdf.cell(100, 5, '', 0, 0)
-    pdf.set_font('Times', 'B', 9)
-    pdf.cell(90, 5, 'Authorized Signatory', 0, 1, 'L')
-    pdf.cell(100, 5, '', 0, 0)
-    pdf.set_font('Times', '', 8)
-    pdf.cell(90, 4, 'Revenue & Land Estate Mgmt. Dept., CSIDC', 0, 1, 'L')
+    pdf._signature('Times', 'By Order,', 'Authorized Signatory',
+                   'Revenue & Land Estate Mgmt. Dept., CSIDC')
     pdf.ln(2)
     pdf.set_font('Times', 'I', 7)
     pdf.set_text_color(80, 80, 80)
@@ -697,9 +1086,9 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
         pdf.multi_cell(0, 5,
             f'\u092a\u094d\u0930\u093e\u0925\u092e\u093f\u0915 \u092a\u0939\u091a\u093e\u0928 \u0906\u0927\u093e\u0930: {primary_hi}\u0964\n\n'
             f'(a) NDVI \u0935\u0928\u0938\u094d\u092a\u0924\u093f \u0938\u0942\u091a\u0915\u093e\u0902\u0915 (Sentinel-2):\n'
-            f'    \u0938\u094d\u0915\u094b\u0930: {ndvi_display}  |  \u0938\u0940\u092e\u093e: 0.20  |  \u092e\u0942\u0932\u094d\u092f\u093e\u0902\u0915\u0928: {ndvi_str}\n\n'
+            f'    \u0938\u094d\u0915\u094b\u0930: {ndvi_display}  |  \u0938\u0940\u092e\u093e: {NDVI_VACANT_THRESHOLD:.2f}  |  \u092e\u0942\u0932\u094d\u092f\u093e\u0902\u0915\u0928: {ndvi_str}\n\n'
             f'(b) VV \u0930\u0921\u093e\u0930 \u092c\u0948\u0915\u0938\u094d\u0915\u0948\u091f\u0930 (Sentinel-1 SAR):\n'
-            f'    \u0938\u094d\u0915\u094b\u0930: {radar_display}  |  \u0938\u0940\u092e\u093e: -11.0 dB  |  \u092e\u0942\u0932\u094d\u092f\u093e\u0902\u0915\u0928: {radar_str}\n\n'
+            f'    \u0938\u094d\u0915\u094b\u0930: {radar_display}  |  \u0938\u0940\u092e\u093e: {VV_ENCROACHED_DB:.1f} dB  |  \u092e\u0942\u0932\u094d\u092f\u093e\u0902\u0915\u0928: {radar_str}\n\n'
             f'AI \u0935\u093f\u0936\u094d\u0935\u093e\u0938 \u0938\u094d\u0915\u094b\u0930: {conf_display}'
         )
         pdf.ln(2)
@@ -722,79 +1111,275 @@ def create_notice(plot_id, violation_type, excess_area_sqm=0,
         # Directives Hindi
         pdf.set_font('Hindi', 'B', 9)
         pdf.cell(0, 5, '\u0928\u093f\u0930\u094d\u0926\u0947\u0936:', 0, 1, 'L')
-        pdf.set_font('Hindi', '', 9)
-        pdf.multi_cell(0, 5,
-            '1. \u0938\u092d\u0940 \u0905\u0928\u0927\u093f\u0915\u0943\u0924 \u0928\u093f\u0930\u094d\u092e\u093e\u0923 \u090f\u0935\u0902 \u092d\u0942\u092e\u093f \u0909\u092a\u092f\u094b\u0917 \u0917\u0924\u093f\u0935\u093f\u0927\u093f\u092f\u093e\u0902 \u0924\u0941\u0930\u0902\u0924 \u092c\u0902\u0926 \u0915\u0930\u0947\u0902\u0964\n'
-            f'2. Rs. {total_liability:,}/- 15 \u0926\u093f\u0928\u094b\u0902 \u092e\u0947\u0902 \u091c\u092e\u093e \u0915\u0930\u0947\u0902\u0964\n'
-            '3. \u092d\u0942\u092e\u093f \u0915\u094b \u0928\u093f\u0930\u094d\u0927\u093e\u0930\u093f\u0924 \u0914\u0926\u094d\u092f\u094b\u0917\u093f\u0915 \u0909\u092a\u092f\u094b\u0917 \u092e\u0947\u0902 \u092a\u0941\u0928\u0903\u0938\u094d\u0925\u093e\u092a\u093f\u0924 \u0915\u0930\u0947\u0902\u0964\n'
-            '4. \u0928\u093f\u0930\u094d\u0927\u093e\u0930\u093f\u0924 \u0938\u0941\u0928\u0935\u093e\u0908 \u0924\u093f\u0925\u093f \u092a\u0930 \u0930\u093e\u091c\u0938\u094d\u0935 \u0928\u094d\u092f\u093e\u092f\u093e\u0932\u092f / \u0924\u0939\u0938\u0940\u0932\u0926\u093e\u0930 \u0915\u0947 \u0938\u092e\u0915\u094d\u0937 \u0909\u092a\u0938\u094d\u0925\u093f\u0924 \u0939\u094b\u0902\u0964\n'
-            '5. \u0938\u092d\u0940 \u0906\u0935\u0902\u091f\u0928 \u0926\u0938\u094d\u0924\u093e\u0935\u0947\u091c\u093c, \u092d\u0935\u0928 \u0905\u0928\u0941\u092e\u0924\u093f \u090f\u0935\u0902 \u092d\u0942\u092e\u093f \u0905\u092d\u093f\u0932\u0947\u0916 \u092a\u094d\u0930\u0938\u094d\u0924\u0941\u0924 \u0915\u0930\u0947\u0902\u0964'
-        )
+        pdf._hindi_block(5, DIRECTIVES_HI.format(total=f'{total_liability:,}'))
         pdf.ln(1)
 
         # Warning Hindi
-        pdf.set_font('Hindi', 'B', 8)
-        pdf.multi_cell(0, 4.5,
-            '\u091a\u0947\u0924\u093e\u0935\u0928\u0940: 15 \u0926\u093f\u0928\u094b\u0902 \u092e\u0947\u0902 \u0905\u0928\u0941\u092a\u093e\u0932\u0928 \u0928 \u0915\u0930\u0928\u0947 \u092a\u0930: (\u0915) \u0906\u092a\u0915\u0940 \u0932\u093e\u0917\u0924 \u092a\u0930 \u0905\u0928\u0927\u093f\u0915\u0943\u0924 \u0928\u093f\u0930\u094d\u092e\u093e\u0923 \u0927\u094d\u0935\u0938\u094d\u0924\u0940\u0915\u0930\u0923, '
-            '(\u0916) \u092d\u0942-\u0930\u093e\u091c\u0938\u094d\u0935 \u092c\u0915\u093e\u092f\u093e \u0915\u0947 \u0930\u0942\u092a \u092e\u0947\u0902 \u0935\u0938\u0942\u0932\u0940, '
-            '(\u0917) \u092a\u094d\u0932\u0949\u091f \u0906\u0935\u0902\u091f\u0928 \u0930\u0926\u094d\u0926, (\u0918) \u0932\u093e\u0917\u0942 \u0915\u093e\u0928\u0942\u0928\u094b\u0902 \u0915\u0947 \u0924\u0939\u0924 \u0906\u092a\u0930\u093e\u0927\u093f\u0915 \u0905\u092d\u093f\u092f\u094b\u091c\u0928\u0964'
-        )
+        pdf._hindi_block(4.5, WARNING_HI, 'B', 8)
         pdf.ln(3)
 
         # Signature Hindi
-        pdf.set_font('Hindi', '', 9)
-        pdf.cell(100, 5, '', 0, 0)
-        pdf.cell(90, 5, '\u0906\u0926\u0947\u0936 \u0926\u094d\u0935\u093e\u0930\u093e,', 0, 1, 'L')
-        pdf.ln(6)
-        pdf.cell(100, 5, '', 0, 0)
-        pdf.set_font('Hindi', 'B', 9)
-        pdf.cell(90, 5, '\u0905\u0927\u093f\u0915\u0943\u0924 \u0939\u0938\u094d\u0924\u093e\u0915\u094d\u0937\u0930\u0915\u0930\u094d\u0924\u093e', 0, 1, 'L')
-        pdf.cell(100, 5, '', 0, 0)
-        pdf.set_font('Hindi', '', 8)
-        pdf.cell(90, 4, '\u0930\u093e\u091c\u0938\u094d\u0935 \u090f\u0935\u0902 \u092d\u0942-\u0938\u0902\u092a\u0926\u093e \u092a\u094d\u0930\u092c\u0902\u0927\u0928 \u0935\u093f\u092d\u093e\u0917, CSIDC', 0, 1, 'L')
+        pdf._signature('Hindi',
+                       '\u0906\u0926\u0947\u0936 \u0926\u094d\u0935\u093e\u0930\u093e,',
+                       '\u0905\u0927\u093f\u0915\u0943\u0924 \u0939\u0938\u094d\u0924\u093e\u0915\u094d\u0937\u0930\u0915\u0930\u094d\u0924\u093e',
+                       '\u0930\u093e\u091c\u0938\u094d\u0935 \u090f\u0935\u0902 \u092d\u0942-\u0938\u0902\u092a\u0926\u093e \u092a\u094d\u0930\u092c\u0902\u0927\u0928 \u0935\u093f\u092d\u093e\u0917, CSIDC')
+
+    if batch is not None:
+        batch._notices.append((filename, pdf._first_page, pdf.page))
+        return filename, None
+
+    pdf_bytes = _pdf_bytes(pdf)
+    _archive_pdf(filename, pdf_bytes)
+    return (filename, pdf_bytes) if as_bytes else filename
+
+def _archive_pdf(filename, pdf_bytes):
+    """Keep a rendered notice under pdfs/ for /download (unless ARCHIVE_PDFS=0)."""
+    if not ARCHIVE_PDFS:
+        return
+    # Write to a temp file first so a concurrent request never sees a partial PDF
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=PDF_DIR)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_path, os.path.join(PDF_DIR, filename))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _notice_batch(items):
+    """
+    Render many /generate_notices items through one GazettePDF and split
+    the result per notice. The Hindi font is loaded and subset once per
+    batch instead of once per notice. Page totals are left as a literal
+    {nb} and filled in per notice when splitting.
+    Returns [(filename, pdf_bytes), ...] in item order.
+    """
+    batch = GazettePDF()
+    if not FPDF_VERSION.startswith('1.'):
+        batch.alias_nb_pages('')  # fpdf2 substitutes {nb} by default; legacy fpdf only once aliased
+    results = [_notice_from_request(item, batch=batch) for item in items]
+    if not batch._notices:  # all cached on disk
+        return results
+
+    reader = PdfReader(io.BytesIO(_pdf_bytes(batch)))
+    rendered = {}
+    for filename, first, last in batch._notices:
+        writer = PdfWriter()
+        nb = str(last - first + 1).encode('latin-1')
+        for number in range(first, last + 1):
+            page = writer.add_page(reader.pages[number - 1])
+            contents = page['/Contents'].get_object()
+            contents.set_data(contents.get_data().replace(b'{nb}', nb))
+        buf = io.BytesIO()
+        writer.write(buf)
+        rendered[filename] = buf.getvalue()
+        _archive_pdf(filename, rendered[filename])
+    return [(filename, rendered[filename] if pdf_bytes is None else pdf_bytes)
+            for filename, pdf_bytes in results]
+
+def _pdf_bytes(pdf):
+    """
+    Render to memory. fpdf2 assembles the document, with its content
+    streams already zlib-compressed, in one bytearray that is passed on
+    as-is (no bytes() copy); legacy fpdf builds a latin-1 str instead.
+    """
+    if FPDF_VERSION.startswith('1.'):
+        return pdf.output(dest='S').encode('latin-1')
+    return pdf.output()
 
-    filename = f"NOTICE_{plot_id}_{date_short}.pdf"
-    filepath = os.path.join(PDF_DIR, filename)
-    pdf.output(filepath)
-    return filename
 
+_ONES = ('', 'One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine',
+         'Ten', 'Eleven', 'Twelve', 'Thirteen', 'Fourteen', 'Fifteen', 'Sixteen',
+         'Seventeen', 'Eighteen', 'Nineteen')
+_TENS = ('', '', 'Twenty', 'Thirty', 'Forty', 'Fifty', 'Sixty', 'Seventy', 'Eighty', 'Ninety')
+
+@lru_cache(maxsize=1024)
+def _two_digits(num):
+    if num < 20:
+        return _ONES[num]
+    return _TENS[num // 10] + ('' if num % 10 == 0 else ' ' + _ONES[num % 10])
+
+@lru_cache(maxsize=1024)
+def _three_digits(num):
+    if num < 100:
+        return _two_digits(num)
+    return _ONES[num // 100] + ' Hundred' + ('' if num % 100 == 0 else ' and ' + _two_digits(num % 100))
 
+@lru_cache(maxsize=4096)
 def _number_to_words(n):
     """Convert a number to Indian English words (for cheque-style amount display)."""
     if n == 0:
         return 'Zero'
-    ones = ['', 'One', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight', 'Nine',
-            'Ten', 'Eleven', 'Twelve', 'Thirteen', 'Fourteen', 'Fifteen', 'Sixteen',
-            'Seventeen', 'Eighteen', 'Nineteen']
-    tens = ['', '', 'Twenty', 'Thirty', 'Forty', 'Fifty', 'Sixty', 'Seventy', 'Eighty', 'Ninety']
-
-    def two_digits(num):
-        if num < 20:
-            return ones[num]
-        return tens[num // 10] + ('' if num % 10 == 0 else ' ' + ones[num % 10])
-
-    def three_digits(num):
-        if num < 100:
-            return two_digits(num)
-        return ones[num // 100] + ' Hundred' + ('' if num % 100 == 0 else ' and ' + two_digits(num % 100))
 
     # Indian numbering: Lakh (1,00,000), Crore (1,00,00,000)
     parts = []
     if n >= 10000000:
-        parts.append(two_digits(n // 10000000) + ' Crore')
+        parts.append(_two_digits(n // 10000000) + ' Crore')
         n %= 10000000
     if n >= 100000:
-        parts.append(two_digits(n // 100000) + ' Lakh')
+        parts.append(_two_digits(n // 100000) + ' Lakh')
         n %= 100000
     if n >= 1000:
-        parts.append(two_digits(n // 1000) + ' Thousand')
+        parts.append(_two_digits(n // 1000) + ' Thousand')
         n %= 1000
     if n > 0:
-        parts.append(three_digits(n))
+        parts.append(_three_digits(n))
     return ' '.join(parts)
 
+# --- RESULT CACHE ---
+# A plot's satellite results only change when a new pass lands, so
+# memoize them per (polygon, day). Sentinel revisits take days, so a
+# 6-hour TTL rarely serves stale data; EE_CACHE_TTL (seconds) overrides it.
+EE_CACHE_TTL = int(os.getenv('EE_CACHE_TTL', 6 * 3600))
+_ee_cache = TTLCache(maxsize=4096, ttl=EE_CACHE_TTL)
+_ee_cache_lock = threading.Lock()
+
+def _freeze(coords):
+    """Nested lists -> nested tuples, so the polygon itself is the key."""
+    try:
+        # Cleaned polygons are rings of [lon, lat]; build those in C
+        frozen = tuple(tuple(map(tuple, ring)) for ring in coords)
+        hash(frozen)
+        return frozen
+    except TypeError:
+        return tuple(_freeze(c) if isinstance(c, list) else c for c in coords)
+
+def _plot_key(coords):
+    """
+    Hashable cleaned polygon plus today's date. Regular polygons are
+    canonicalised by NumPy: float64 rounded to 1e-7 deg (~1 cm), so ints
+    vs floats and -0.0 vs 0.0 land on the same entry, keyed by raw bytes.
+    """
+    try:
+        arr = np.round(np.asarray(coords, dtype=np.float64), 7) + 0.0
+        key = (arr.shape, arr.tobytes())
+    except ValueError:
+        key = _freeze(coords)
+    return key, datetime.date.today().isoformat()
+
+def _plot_cached(kind, coords, compute):
+    """
+    Return compute() memoized under (kind, polygon, day). Exceptions
+    propagate uncached, and results carrying an 'Analysis Error'
+    status are treated as transient and not stored either.
+    """
+    key = (kind,) + _plot_key(coords)
+    with _ee_cache_lock:
+        result = _ee_cache.get(key)
+    if result is None:
+        result = compute()
+        transient = any(isinstance(v, dict) and v.get('status') == 'Analysis Error'
+                        for v in result.values())
+        if not transient:
+            with _ee_cache_lock:
+                _ee_cache[key] = result
+        elif has_request_context():
+            g.transient = True  # keep _body_cached from storing it either
+    return result
+
+# Staged tilesets outlive the analysis numbers: the same polygon and day
+# always maps to the same composites, so keep their map IDs for the day
+# and share them between /get_overlay_tiles and /analyze_full.
+_tile_cache = TTLCache(maxsize=2048, ttl=86400)
+
+def _staged_map_id(key, image):
+    map_id = image.getMapId()
+    with _ee_cache_lock:
+        _tile_cache[key] = map_id
+    return map_id
+
+def _map_id_futures(final_coords, layers):
+    """getMapId() future per layer, resolved at once when staged today."""
+    plot_key = _plot_key(final_coords)
+    futures = {}
+    for name, image in layers.items():
+        key = (name,) + plot_key
+        with _ee_cache_lock:
+            map_id = _tile_cache.get(key)
+        if map_id is None:
+            futures[name] = _ee_pool.submit(_staged_map_id, key, image)
+        else:
+            futures[name] = Future()
+            futures[name].set_result(map_id)
+    return futures
+
+# Dashboards re-POST identical bodies while polling; replay the stored
+# response for those without re-entering the handler at all.
+_response_cache = TTLCache(maxsize=256, ttl=EE_CACHE_TTL)
+
+def _body_cached(view):
+    """
+    Memoize a POST endpoint's 200 response under (path, body hash, day).
+    Responses built from transient results (see _plot_cached) are not stored.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        digest = hashlib.blake2b(request.get_data(), digest_size=16).digest()
+        key = (request.path, digest, datetime.date.today().isoformat())
+        with _ee_cache_lock:
+            body = _response_cache.get(key)
+        if body is not None:
+            return app.response_class(body, mimetype='application/json')
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200 and not g.get('transient'):
+            with _ee_cache_lock:
+                _response_cache[key] = response.get_data()
+        return response
+    return wrapper
+
 # --- API ENDPOINTS ---
+@app.route('/health')
+def health():
+    return jsonify({"status": "ok", "gee_initialized": _ee_initialized})
+
+def _analysis_payload(final_coords, vacancy, encroachment):
+    """Area maths + verdict for /analyze_plot, given the two sensor results."""
+    # 2. Calculate area
+    total_area_sqkm = calculate_polygon_area(final_coords)
+    total_area_sqm = total_area_sqkm * 1_000_000  # Convert to square meters
+    
+    # 4. Calculate excess area
+    excess_area_sqkm = calculate_excess_area(encroachment['score'], total_area_sqkm)
+    excess_area_sqm = excess_area_sqkm * 1_000_000  # Convert to square meters
+    
+    # 5. UPDATED LOGIC: Prioritize Radar for structural violations
+    is_violating = encroachment['is_encroached'] 
+    
+    if is_violating:
+        summary = f"⚠️ Unauthorized structure detected via Radar analysis. Excess area: {excess_area_sqm:.2f} sq.m"
+    elif not vacancy['is_vacant']:
+        # Low vegetation but no structure
+        summary = "ℹ️ Low vegetation index detected; no permanent structures found."
+    else:
+        summary = "✅ Plot is compliant and currently vacant."
+    
+    return {
+        "is_violating": is_violating,
+        "analysis_summary": summary,
+        "confidence_score": 0.92,
+        "vacancy_analysis": vacancy,
+        "encroachment_analysis": encroachment,
+        "area_analysis": {
+            "total_area_sqkm": round(total_area_sqkm, 4),
+            "total_area_sqm": round(total_area_sqm, 2),
+            "excess_area_sqkm": round(excess_area_sqkm, 4),
+            "excess_area_sqm": round(excess_area_sqm, 2),
+            "excess_area_sqft": round(excess_area_sqm * 10.764, 2),
+            "utilization_ratio": round((excess_area_sqm / total_area_sqm * 100) if total_area_sqm > 0 else 0, 2)
+        }
+    }
+
+def _analyze_plot_result(final_coords):
+    """Area + sensor analysis for a cleaned polygon (everything but plot_id)."""
+    _ensure_ee()
+    roi = ee.Geometry.Polygon(final_coords)
+    
+    # 3. Sensor Analysis
+    vacancy, encroachment = check_plot(roi)
+    return _analysis_payload(final_coords, vacancy, encroachment)
+
 @app.route('/analyze_plot', methods=['POST'])
+@_body_cached
 def analyze_plot():
     try:
         data = request.json
@@ -802,144 +1387,208 @@ def analyze_plot():
         coords = data.get('coordinates') 
         
         # 1. Coordinate Cleaning
-        def clean_coords(c_list):
-            if isinstance(c_list[0], list):
-                return [clean_coords(sub) for sub in c_list]
-            return [c_list[0], c_list[1]]
-
-        temp_coords = coords
-        while isinstance(temp_coords, list) and len(temp_coords) == 1 and isinstance(temp_coords[0][0], list):
-            temp_coords = temp_coords[0]
-            
-        final_coords = clean_coords(temp_coords)
+        final_coords = _clean_coords(coords)
         
-        # 2. Calculate area
-        total_area_sqkm = calculate_polygon_area(final_coords)
-        total_area_sqm = total_area_sqkm * 1_000_000  # Convert to square meters
-        
-        roi = ee.Geometry.Polygon(final_coords)
-        
-        # 3. Sensor Analysis
-        vacancy = check_vegetation(roi)
-        encroachment = check_encroachment(roi)
-        
-        # 4. Calculate excess area
-        excess_area_sqkm = calculate_excess_area(encroachment['score'], total_area_sqkm)
-        excess_area_sqm = excess_area_sqkm * 1_000_000  # Convert to square meters
-        
-        # 5. UPDATED LOGIC: Prioritize Radar for structural violations
-        is_violating = encroachment['is_encroached'] 
-        
-        if is_violating:
-            summary = f"⚠️ Unauthorized structure detected via Radar analysis. Excess area: {excess_area_sqm:.2f} sq.m"
-        elif not vacancy['is_vacant']:
-            # Low vegetation but no structure
-            summary = "ℹ️ Low vegetation index detected; no permanent structures found."
-        else:
-            summary = "✅ Plot is compliant and currently vacant."
-        
-        return jsonify({
-            "plot_id": plot_id,
-            "is_violating": is_violating,
-            "analysis_summary": summary,
-            "confidence_score": 0.92,
-            "vacancy_analysis": vacancy,
-            "encroachment_analysis": encroachment,
-            "area_analysis": {
-                "total_area_sqkm": round(total_area_sqkm, 4),
-                "total_area_sqm": round(total_area_sqm, 2),
-                "excess_area_sqkm": round(excess_area_sqkm, 4),
-                "excess_area_sqm": round(excess_area_sqm, 2),
-                "excess_area_sqft": round(excess_area_sqm * 10.764, 2),
-                "utilization_ratio": round((excess_area_sqm / total_area_sqm * 100) if total_area_sqm > 0 else 0, 2)
-            }
-        })
+        result = _plot_cached('analysis', final_coords, lambda: _analyze_plot_result(final_coords))
+        return jsonify({"plot_id": plot_id, **result})
     except Exception as e:
         print(f"❌ Analysis Error: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+def _timeline_list(roi):
+    """Lazy ee.List of [date, encroached_area] for the last 12 months of Sentinel-1."""
+    # 2. Get Sentinel-1 data for last 12 months
+    start_date, end_date = _date_window(365)
+    
+    s1_collection = ee.ImageCollection('COPERNICUS/S1_GRD') \
+        .filterBounds(roi) \
+        .filterDate(start_date, end_date) \
+        .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
+        .filter(ee.Filter.eq('instrumentMode', 'IW'))
+    
+    # 3. Calculate encroached area for each image
+    def calculate_encroachment_area(image):
+        # Threshold: VV > VV_ENCROACHED_DB indicates encroachment
+        encroached = _despeckle(image).gt(VV_ENCROACHED_DB)
+        # Multiply by pixel area to get area in square meters
+        area_image = encroached.multiply(ee.Image.pixelArea())
+        # Sum up the total encroached area
+        area_stats = area_image.reduceRegion(
+            reducer=ee.Reducer.sum(),
+            geometry=roi,
+            scale=10,
+            maxPixels=1e9,
+            tileScale=4
+        )
+        
+        # Get the date of the image
+        date = ee.Date(image.get('system:time_start')).format('YYYY-MM-dd')
+        
+        return ee.Feature(None, {
+            'date': date,
+            'encroached_area': area_stats.get('VV')
+        })
+    
+    # Map over collection and extract timeline data
+    timeline_features = s1_collection.map(calculate_encroachment_area)
+    return timeline_features.reduceColumns(
+        ee.Reducer.toList(2), 
+        ['date', 'encroached_area']
+    ).get('list')
+
+def _timeline_payload(timeline_list):
+    """Format the fetched [date, area] pairs for /analyze_timeline."""
+    # 4. Format and sort the results
+    timeline_data = []
+    for item in timeline_list:
+        if item[1] is not None:  # Skip if area calculation failed
+            timeline_data.append({
+                'date': item[0],
+                'encroached_area': round(float(item[1]), 2)
+            })
+    
+    # Sort by date
+    timeline_data.sort(key=lambda x: x['date'])
+    
+    return {
+        'timeline': timeline_data,
+        'data_points': len(timeline_data)
+    }
+
+def _timeline_result(final_coords):
+    """12-month Sentinel-1 encroached-area series for a cleaned polygon."""
+    _ensure_ee()
+    roi = ee.Geometry.Polygon(final_coords)
+    return _timeline_payload(_timeline_list(roi).getInfo())
+
 @app.route('/analyze_timeline', methods=['POST'])
+@_body_cached
 def analyze_timeline():
     try:
         data = request.json
         plot_id = data.get('plot_id', 'Unknown')
         coords = data.get('coordinates')
         
-        # 1. Coordinate Cleaning (same as analyze_plot)
-        def clean_coords(c_list):
-            if isinstance(c_list[0], list):
-                return [clean_coords(sub) for sub in c_list]
-            return [c_list[0], c_list[1]]
-
-        temp_coords = coords
-        while isinstance(temp_coords, list) and len(temp_coords) == 1 and isinstance(temp_coords[0][0], list):
-            temp_coords = temp_coords[0]
-            
-        final_coords = clean_coords(temp_coords)
-        roi = ee.Geometry.Polygon(final_coords)
-        
-        # 2. Get Sentinel-1 data for last 12 months
-        end_date = datetime.datetime.now()
-        start_date = end_date - datetime.timedelta(days=365)
-        
-        s1_collection = ee.ImageCollection('COPERNICUS/S1_GRD') \
-            .filterBounds(roi) \
-            .filterDate(start_date, end_date) \
-            .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
-            .filter(ee.Filter.eq('instrumentMode', 'IW'))
-        
-        # 3. Calculate encroached area for each image
-        def calculate_encroachment_area(image):
-            # Threshold: VV > -11.0 indicates encroachment
-            encroached = image.select('VV').gt(-11.0)
-            # Multiply by pixel area to get area in square meters
-            area_image = encroached.multiply(ee.Image.pixelArea())
-            # Sum up the total encroached area
-            area_stats = area_image.reduceRegion(
-                reducer=ee.Reducer.sum(),
-                geometry=roi,
-                scale=10,
-                maxPixels=1e9
-            )
-            
-            # Get the date of the image
-            date = ee.Date(image.get('system:time_start')).format('YYYY-MM-dd')
-            
-            return ee.Feature(None, {
-                'date': date,
-                'encroached_area': area_stats.get('VV')
-            })
-        
-        # Map over collection and extract timeline data
-        timeline_features = s1_collection.map(calculate_encroachment_area)
-        timeline_list = timeline_features.reduceColumns(
-            ee.Reducer.toList(2), 
-            ['date', 'encroached_area']
-        ).get('list').getInfo()
-        
-        # 4. Format and sort the results
-        timeline_data = []
-        for item in timeline_list:
-            if item[1] is not None:  # Skip if area calculation failed
-                timeline_data.append({
-                    'date': item[0],
-                    'encroached_area': round(float(item[1]), 2)
-                })
-        
-        # Sort by date
-        timeline_data.sort(key=lambda x: x['date'])
+        # 1. Coordinate Cleaning
+        final_coords = _clean_coords(coords)
         
-        return jsonify({
-            'plot_id': plot_id,
-            'timeline': timeline_data,
-            'data_points': len(timeline_data)
-        })
+        result = _plot_cached('timeline', final_coords, lambda: _timeline_result(final_coords))
+        return jsonify({'plot_id': plot_id, **result})
         
     except Exception as e:
         print(f"❌ Timeline Analysis Error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _overlay_layers(roi):
+    """
+    Lazy overlay images keyed by tile name, plus the lazy encroached
+    area (sq.m). Nothing here touches the network.
+    """
+    start_date, end_date = _date_window(30)
+    
+    # 2. Sentinel-1 Radar — Encroachment mask (same 30-day mean as check_plot)
+    s1 = _s1_composite(roi)
+    
+    # Create encroachment mask: VV > VV_ENCROACHED_DB means structure detected
+    encroachment_mask = s1.select('VV').gt(VV_ENCROACHED_DB)
+    
+    # Calculate encroached area in sq meters
+    encroached_area_img = encroachment_mask.multiply(ee.Image.pixelArea())
+    encroached_stats = encroached_area_img.reduceRegion(
+        reducer=ee.Reducer.sum(),
+        geometry=roi,
+        scale=10,
+        maxPixels=1e9,
+        tileScale=4
+    )
+    
+    # Style the encroachment mask for visualization
+    encroachment_vis = encroachment_mask.selfMask().visualize(**{
+        'palette': ['#ff0000'],
+        'min': 0,
+        'max': 1,
+        'opacity': 0.65
+    })
+    
+    # 3. Sentinel-2 True Color — Natural satellite view
+    # One median over just the bands both S2 layers use, shared by the
+    # true-colour and NDVI visualizations below.
+    s2 = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED') \
+        .filterBounds(roi) \
+        .filterDate(start_date, end_date) \
+        .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 30)) \
+        .select(['B2', 'B3', 'B4', 'B8']) \
+        .median().clip(roi)
+    
+    s2_vis = s2.visualize(**{
+        'bands': ['B4', 'B3', 'B2'],
+        'min': 0,
+        'max': 3000,
+        'gamma': 1.3
+    })
+    
+    # 4. NDVI Vegetation overlay
+    ndvi = s2.normalizedDifference(['B8', 'B4']).rename('NDVI')
+    ndvi_vis = ndvi.visualize(**{
+        'min': -0.1,
+        'max': 0.6,
+        'palette': ['#d73027', '#fc8d59', '#fee08b', '#d9ef8b', '#91cf60', '#1a9850']
+    })
+    
+    # 5. Radar backscatter visualization
+    vv_vis = s1.select('VV').visualize(**{
+        'min': -25,
+        'max': 0,
+        'palette': ['#000004', '#3b0f70', '#8c2981', '#de4968', '#fe9f6d', '#fcfdbf']
+    })
+    
+    layers = {
+        'encroachment': encroachment_vis,
+        'satellite': s2_vis,
+        'ndvi': ndvi_vis,
+        'radar': vv_vis
+    }
+    return layers, encroached_stats.get('VV')
+
+def _overlay_payload(map_ids, encroached_area_sqm, total_area_sqm):
+    """Tile URLs + area breakdown for /get_overlay_tiles."""
+    encroached_area_sqm = encroached_area_sqm or 0
+    clean_area_sqm = max(total_area_sqm - encroached_area_sqm, 0)
+    
+    return {
+        'tiles': {name: m['tile_fetcher'].url_format for name, m in map_ids.items()},
+        'area_breakdown': {
+            'total_sqm': round(total_area_sqm, 2),
+            'encroached_sqm': round(encroached_area_sqm, 2),
+            'clean_sqm': round(clean_area_sqm, 2),
+            'encroachment_pct': round((encroached_area_sqm / total_area_sqm * 100) if total_area_sqm > 0 else 0, 1)
+        }
+    }
+
+def _overlay_tiles_result(final_coords, total_area_sqm=None):
+    """
+    Tile URLs and area breakdown for a cleaned polygon. A total area the
+    client already has from /analyze_plot saves EE measuring it again.
+    """
+    _ensure_ee()
+    roi = ee.Geometry.Polygon(final_coords)
+    layers, encroached = _overlay_layers(roi)
+    
+    # 6. Both areas come back in one getInfo(), run alongside the four
+    #    independent getMapId() calls
+    summary = ee.Dictionary({
+        'encroached': encroached,
+        'total_area': roi.area(1) if total_area_sqm is None else total_area_sqm  # 1m precision
+    })
+    summary_future = _ee_pool.submit(summary.getInfo)
+    map_futures = _map_id_futures(final_coords, layers)
+    
+    areas = summary_future.result()
+    map_ids = {name: f.result() for name, f in map_futures.items()}
+    return _overlay_payload(map_ids, areas['encroached'], areas['total_area'])
+
 @app.route('/get_overlay_tiles', methods=['POST'])
+@_body_cached
 def get_overlay_tiles():
     """Generate GEE tile URLs for satellite overlay comparison."""
     try:
@@ -948,168 +1597,243 @@ def get_overlay_tiles():
         coords = data.get('coordinates')
         
         # 1. Coordinate Cleaning
-        def clean_coords(c_list):
-            if isinstance(c_list[0], list):
-                return [clean_coords(sub) for sub in c_list]
-            return [c_list[0], c_list[1]]
-
-        temp_coords = coords
-        while isinstance(temp_coords, list) and len(temp_coords) == 1 and isinstance(temp_coords[0][0], list):
-            temp_coords = temp_coords[0]
-            
-        final_coords = clean_coords(temp_coords)
-        roi = ee.Geometry.Polygon(final_coords)
-        
-        end_date = datetime.datetime.now()
-        start_date = end_date - datetime.timedelta(days=30)
-        
-        # 2. Sentinel-1 Radar — Encroachment mask
-        s1 = ee.ImageCollection('COPERNICUS/S1_GRD') \
-            .filterBounds(roi) \
-            .filterDate(start_date, end_date) \
-            .filter(ee.Filter.listContains('transmitterReceiverPolarisation', 'VV')) \
-            .filter(ee.Filter.eq('instrumentMode', 'IW')) \
-            .mean().clip(roi)
-        
-        # Create encroachment mask: VV > -11.0 means structure detected
-        encroachment_mask = s1.select('VV').gt(-11.0)
-        
-        # Calculate encroached area in sq meters
-        encroached_area_img = encroachment_mask.multiply(ee.Image.pixelArea())
-        encroached_stats = encroached_area_img.reduceRegion(
-            reducer=ee.Reducer.sum(),
-            geometry=roi,
-            scale=10,
-            maxPixels=1e9
-        )
-        encroached_area_sqm = encroached_stats.get('VV').getInfo() or 0
-        
-        # Total plot area
-        total_area_sqm = roi.area(1).getInfo()  # 1m precision
-        clean_area_sqm = max(total_area_sqm - encroached_area_sqm, 0)
-        
-        # Style the encroachment mask for visualization
-        encroachment_vis = encroachment_mask.selfMask().visualize(**{
-            'palette': ['#ff0000'],
-            'min': 0,
-            'max': 1,
-            'opacity': 0.65
-        })
-        
-        # Get tile URL for encroachment overlay
-        encroachment_map = encroachment_vis.getMapId()
-        encroachment_tile_url = encroachment_map['tile_fetcher'].url_format
-        
-        # 3. Sentinel-2 True Color — Natural satellite view
-        s2 = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED') \
-            .filterBounds(roi) \
-            .filterDate(start_date, end_date) \
-            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 30)) \
-            .median().clip(roi)
+        final_coords = _clean_coords(coords)
         
-        s2_vis = s2.visualize(**{
-            'bands': ['B4', 'B3', 'B2'],
-            'min': 0,
-            'max': 3000,
-            'gamma': 1.3
-        })
-        
-        s2_map = s2_vis.getMapId()
-        s2_tile_url = s2_map['tile_fetcher'].url_format
-        
-        # 4. NDVI Vegetation overlay
-        ndvi = s2.normalizedDifference(['B8', 'B4']).rename('NDVI').clip(roi)
-        ndvi_vis = ndvi.visualize(**{
-            'min': -0.1,
-            'max': 0.6,
-            'palette': ['#d73027', '#fc8d59', '#fee08b', '#d9ef8b', '#91cf60', '#1a9850']
-        })
+        # Area from /analyze_plot, if the client passes it back
+        try:
+            total_area_sqm = float(data['total_area_sqm'])
+        except (KeyError, TypeError, ValueError):
+            total_area_sqm = None
         
-        ndvi_map = ndvi_vis.getMapId()
-        ndvi_tile_url = ndvi_map['tile_fetcher'].url_format
-        
-        # 5. Radar backscatter visualization
-        vv_vis = s1.select('VV').visualize(**{
-            'min': -25,
-            'max': 0,
-            'palette': ['#000004', '#3b0f70', '#8c2981', '#de4968', '#fe9f6d', '#fcfdbf']
-        })
-        
-        vv_map = vv_vis.getMapId()
-        vv_tile_url = vv_map['tile_fetcher'].url_format
+        result = _plot_cached(('overlay_tiles', total_area_sqm), final_coords,
+                              lambda: _overlay_tiles_result(final_coords, total_area_sqm))
         
         print(f"✅ Overlay tiles generated for {plot_id}")
         
-        return jsonify({
-            'plot_id': plot_id,
-            'tiles': {
-                'encroachment': encroachment_tile_url,
-                'satellite': s2_tile_url,
-                'ndvi': ndvi_tile_url,
-                'radar': vv_tile_url
-            },
-            'area_breakdown': {
-                'total_sqm': round(total_area_sqm, 2),
-                'encroached_sqm': round(encroached_area_sqm, 2),
-                'clean_sqm': round(clean_area_sqm, 2),
-                'encroachment_pct': round((encroached_area_sqm / total_area_sqm * 100) if total_area_sqm > 0 else 0, 1)
-            }
-        })
+        return jsonify({'plot_id': plot_id, **result})
     except Exception as e:
         print(f"❌ Overlay Tiles Error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _full_result(final_coords):
+    """
+    Everything /analyze_plot, /analyze_timeline and /get_overlay_tiles
+    return, in one pass: all numbers come back from a single
+    ee.Dictionary getInfo(), fetched alongside the four getMapId() calls.
+    """
+    _ensure_ee()
+    roi = ee.Geometry.Polygon(final_coords)
+    layers, encroached = _overlay_layers(roi)
+    
+    summary = ee.Dictionary({
+        'means': _sensor_means(roi),
+        'timeline': _timeline_list(roi),
+        'encroached': encroached,
+        'total_area': roi.area(1)
+    })
+    summary_future = _ee_pool.submit(summary.getInfo)
+    map_futures = _map_id_futures(final_coords, layers)
+    
+    try:
+        numbers = summary_future.result()
+    except Exception:
+        # Combined call fails as a whole (e.g. no Sentinel-2 scene); the
+        # per-endpoint paths degrade per sensor instead.
+        return {
+            **_plot_cached('analysis', final_coords, lambda: _analyze_plot_result(final_coords)),
+            **_plot_cached('timeline', final_coords, lambda: _timeline_result(final_coords)),
+            **_plot_cached(('overlay_tiles', None), final_coords, lambda: _overlay_tiles_result(final_coords)),
+        }
+    
+    means = numbers['means']
+    vacancy = _vegetation_result(means.get('NDVI'))
+    encroachment = _encroachment_result(means.get('VV'))
+    map_ids = {name: f.result() for name, f in map_futures.items()}
+    return {
+        **_analysis_payload(final_coords, vacancy, encroachment),
+        **_timeline_payload(numbers['timeline']),
+        **_overlay_payload(map_ids, numbers['encroached'], numbers['total_area']),
+    }
+
+@app.route('/analyze_full', methods=['POST'])
+@_body_cached
+def analyze_full():
+    """Combined analysis + timeline + overlay tiles in one request."""
+    try:
+        data = request.json
+        plot_id = data.get('plot_id', 'Unknown')
+        coords = data.get('coordinates')
+        
+        # 1. Coordinate Cleaning
+        final_coords = _clean_coords(coords)
+        
+        result = _plot_cached('full', final_coords, lambda: _full_result(final_coords))
+        return jsonify({'plot_id': plot_id, **result})
+    except Exception as e:
+        print(f"❌ Full Analysis Error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def _notice_from_request(data, batch=None):
+    """create_notice() for one request body; returns (filename, pdf_bytes)."""
+    plot_id = data.get('plot_id')
+    violation = data.get('violation')
+    excess_area_sqm = data.get('excess_area_sqm', 0)
+
+    # Satellite evidence data (optional, for gazette-format notice)
+    ndvi_score = data.get('ndvi_score')
+    ndvi_status = data.get('ndvi_status')
+    radar_score = data.get('radar_score')
+    radar_status = data.get('radar_status')
+    confidence_score = data.get('confidence_score')
+    total_area_sqm = data.get('total_area_sqm')
+    utilization_ratio = data.get('utilization_ratio')
+    timeline_data = data.get('timeline_data')  # list of {date, encroached_area}
+
+    return create_notice(
+        plot_id, violation, excess_area_sqm,
+        ndvi_score=ndvi_score, ndvi_status=ndvi_status,
+        radar_score=radar_score, radar_status=radar_status,
+        confidence_score=confidence_score,
+        total_area_sqm=total_area_sqm,
+        utilization_ratio=utilization_ratio,
+        timeline_data=timeline_data,
+        as_bytes=True, batch=batch
+    )
+
 @app.route('/generate_notice', methods=['POST'])
 def generate_notice():
     try:
         data = request.json
-        plot_id = data.get('plot_id')
-        violation = data.get('violation')
-        excess_area_sqm = data.get('excess_area_sqm', 0)
-
-        # Satellite evidence data (optional, for gazette-format notice)
-        ndvi_score = data.get('ndvi_score')
-        ndvi_status = data.get('ndvi_status')
-        radar_score = data.get('radar_score')
-        radar_status = data.get('radar_status')
-        confidence_score = data.get('confidence_score')
-        total_area_sqm = data.get('total_area_sqm')
-        utilization_ratio = data.get('utilization_ratio')
-        timeline_data = data.get('timeline_data')  # list of {date, encroached_area}
-
-        filename = create_notice(
-            plot_id, violation, excess_area_sqm,
-            ndvi_score=ndvi_score, ndvi_status=ndvi_status,
-            radar_score=radar_score, radar_status=radar_status,
-            confidence_score=confidence_score,
-            total_area_sqm=total_area_sqm,
-            utilization_ratio=utilization_ratio,
-            timeline_data=timeline_data
-        )
-        filepath = os.path.join(PDF_DIR, filename)
-        return jsonify({
+        filename, pdf_bytes = _notice_from_request(data)
+
+        # ?inline=1 streams the PDF straight back instead of a download link
+        if request.args.get('inline') == '1':
+            return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf',
+                             as_attachment=True, download_name=filename)
+
+        payload = {
             "message": "Legal Notice Generated Successfully (Rajpatra Format)",
             "file": filename,
-            "download_link": f"/download/{filename}",
-            "path": os.path.abspath(filepath)
-        })
+        }
+        if ARCHIVE_PDFS:
+            _remember_pdf(filename, pdf_bytes)  # the dashboard downloads it next
+            payload["download_link"] = f"/download/{filename}"
+            payload["path"] = os.path.abspath(os.path.join(PDF_DIR, filename))
+        else:
+            # Nothing on disk to link to; the PDF travels in the response
+            payload["pdf_base64"] = base64.b64encode(pdf_bytes).decode('ascii')
+        return jsonify(payload)
     except Exception as e:
         print(f"❌ Notice Generation Error: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+# PDF rendering is CPU-bound (layout, zlib), so bulk runs go to worker
+# processes. Created on first use, with 'spawn' so children never inherit
+# a gevent-patched or mid-request parent. The pool is per web worker, so
+# gunicorn.conf.py splits the cores between them via NOTICE_POOL_WORKERS.
+_NOTICE_WORKERS = int(os.getenv('NOTICE_POOL_WORKERS', os.cpu_count() or 1))
+_notice_pool = None
+_notice_pool_lock = threading.Lock()
+
+def _get_notice_pool():
+    global _notice_pool
+    with _notice_pool_lock:
+        if _notice_pool is None:
+            _notice_pool = ProcessPoolExecutor(
+                max_workers=_NOTICE_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'))
+        return _notice_pool
+
+@app.route('/generate_notices', methods=['POST'])
+def generate_notices():
+    """Render many notices (same fields as /generate_notice) into one ZIP."""
+    try:
+        items = request.json
+        if not isinstance(items, list) or not items:
+            return jsonify({"error": "Expected a non-empty list of notices"}), 400
+
+        # One contiguous chunk per worker, each rendered as a single batch
+        size = -(-len(items) // _NOTICE_WORKERS)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w', zipfile.ZIP_STORED) as zf:  # PDFs are already compressed
+            for notices in _get_notice_pool().map(_notice_batch, chunks):
+                for filename, pdf_bytes in notices:
+                    if filename not in zf.NameToInfo:  # identical items render identical notices
+                        zf.writestr(filename, pdf_bytes)
+        buf.seek(0)
+
+        print(f"✅ {len(items)} notices generated")
+        return send_file(buf, mimetype='application/zip', as_attachment=True,
+                         download_name=f"NOTICES_{datetime.datetime.now():%Y%m%d}.zip")
+    except Exception as e:
+        print(f"❌ Bulk Notice Generation Error: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+# Exactly the names create_notice() produces; anything else never touches the disk
+_NOTICE_NAME_RE = re.compile(r'NOTICE_[\w-]{0,64}_\d{8}_[0-9a-f]{16}\.pdf', re.ASCII)
+
+# Recently generated / downloaded notices, by filename, up to 256 MB of PDF
+_pdf_cache = LRUCache(maxsize=256 * 1024 * 1024, getsizeof=len)
+
+def _remember_pdf(filename, pdf_bytes):
+    if len(pdf_bytes) <= _pdf_cache.maxsize:
+        with _ee_cache_lock:
+            _pdf_cache[filename] = bytes(pdf_bytes)
+
 @app.route('/download/<filename>')
 def download_file(filename):
     # Security: Prevent directory traversal attacks
-    if '..' in filename or '/' in filename:
+    if not _NOTICE_NAME_RE.fullmatch(filename):
         return jsonify({"error": "Invalid filename"}), 400
     
+    # When the web server sends the file (see below) there is nothing to cache
+    offloaded = PDF_ACCEL_PREFIX or app.config['USE_X_SENDFILE']
+    if not offloaded:
+        with _ee_cache_lock:
+            pdf_bytes = _pdf_cache.get(filename)
+        if pdf_bytes is not None:
+            return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf',
+                             as_attachment=True, download_name=filename)
+    
     filepath = os.path.join(PDF_DIR, filename)
     
     # Verify file exists before sending
     if not os.path.exists(filepath):
         return jsonify({"error": "File not found"}), 404
     
-    return send_file(filepath, as_attachment=True)
+    if PDF_ACCEL_PREFIX:
+        # nginx sends the file itself; the worker is free immediately
+        response = app.response_class(mimetype='application/pdf')
+        response.headers['X-Accel-Redirect'] = PDF_ACCEL_PREFIX.rstrip('/') + '/' + filename
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+        return response
+    
+    if offloaded:
+        return send_file(filepath, as_attachment=True)  # X-Sendfile
+    
+    with open(filepath, 'rb') as f:
+        pdf_bytes = f.read()
+    _remember_pdf(filename, pdf_bytes)
+    return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf',
+                     as_attachment=True, download_name=filename)
+
+def warmup():
+    """
+    Pay the cold-start costs (Earth Engine auth and token, Hindi font
+    load) before the first request does. Flask 3 has no
+    before_first_request, so gunicorn's post_worker_init hook and
+    __main__ call this instead.
+    """
+    try:
+        _ensure_ee()
+        ee.Number(1).getInfo()  # fetch the OAuth token, open a pooled connection
+    except Exception as e:
+        print(f"⚠️ GEE warm-up skipped: {e}")  # the first request will retry
+    _hindi_measure_pdf()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    warmup()
+    # The reloader imports the app twice; opt in with FLASK_DEBUG=1
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=5001)
\ No newline at end of file
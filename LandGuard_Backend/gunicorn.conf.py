@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for production.
+Usage:  gunicorn app:app   (this file is picked up automatically)
+
+The notice / analysis endpoints spend most of their time waiting on
+Earth Engine getInfo() calls, so gevent workers let each process keep
+many of those requests in flight instead of blocking one per worker.
+"""
+# Patch sockets/ssl before app.py imports ee, so the HTTP clients used by
+# earthengine-api yield to other greenlets while waiting on the network.
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', '4'))
+worker_connections = 1000
+# app._ee_pool fan-outs are greenlets here too; don't cap a worker's
+# in-flight GEE calls at the 8 threads the dev server gets
+os.environ.setdefault('EE_POOL_WORKERS', '256')
+# Each worker starts its own /generate_notices render pool; share the cores
+# out between them instead of spawning workers x cpu_count processes
+os.environ.setdefault('NOTICE_POOL_WORKERS', str(max(1, (os.cpu_count() or 1) // workers)))
+# Import app.py once in the master; workers fork with it already loaded
+preload_app = True
+timeout = 120
+
+
+def post_worker_init(worker):
+    # Authenticate Earth Engine and load fonts before taking traffic
+    from app import warmup
+    warmup()
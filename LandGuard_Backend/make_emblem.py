@@ -1,12 +1,19 @@
 """
 Generate a Chhattisgarh Government Seal emblem PNG for the gazette PDF.
-Creates a 400x400 transparent-background emblem with:
+Creates a 400x400 emblem on a white background with:
 - Green circular border with rice/wheat decorations
 - Ashoka Lion Capital in center (text placeholder)
 - "छत्तीसगढ़ शासन" text
 """
 from PIL import Image, ImageDraw, ImageFont
-import math, os
+import math, os, sys
+
+# The emblem has no runtime inputs: render it once and ship the PNG.
+# Pass --force to redraw after changing this script.
+out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'emblem.png')
+if '--force' not in sys.argv and os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+    print(f"Emblem already exists: {out_path} (use --force to redraw)")
+    sys.exit(0)
 
 SIZE = 400
 CENTER = SIZE // 2
@@ -82,26 +89,39 @@ tw = bbox[2] - bbox[0]
 draw.text((CENTER - tw//2, CENTER + 35), text_sy, fill=DARK_GREEN, font=hindi_font_small)
 
 # === CURVED TEXT: "छत्तीसगढ़" (top arc) and "शासन" (bottom arc) ===
-# Top arc: छत्तीसगढ़
-top_text = "छत्तीसगढ़"
 arc_r = inner_r + 20
-start_angle = -math.pi/2 - 0.45  # start from roughly top-left
-for i, ch in enumerate(top_text):
-    angle = start_angle + i * 0.12
-    x = CENTER + arc_r * math.cos(angle)
-    y = CENTER + arc_r * math.sin(angle)
-    draw.text((x-8, y-10), ch, fill=DARK_GREEN, font=hindi_font_large)
 
-# Bottom arc: शासन
-bot_text = "शासन"
-start_angle_b = math.pi/2 - 0.18
-for i, ch in enumerate(bot_text):
-    angle = start_angle_b + i * 0.12
-    x = CENTER + arc_r * math.cos(angle)
-    y = CENTER + arc_r * math.sin(angle)
-    draw.text((x-8, y-10), ch, fill=DARK_GREEN, font=hindi_font_large)
+def draw_arc_text(text, mid_angle, bottom=False):
+    """
+    Draw text along the ring, centred on mid_angle. The whole string is
+    shaped once onto a transparent strip (keeping Devanagari conjuncts
+    intact), then pasted in thin slices, each rotated to follow the arc.
+    """
+    left, top, right, bot = draw.textbbox((0, 0), text, font=hindi_font_large)
+    w, h = right - left, bot - top
+    strip = Image.new('RGBA', (w, h), (0, 0, 0, 0))
+    ImageDraw.Draw(strip).text((-left, -top), text, fill=DARK_GREEN, font=hindi_font_large)
 
-# Save
-out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'emblem.png')
-img.save(out_path, 'PNG')
+    # Left-to-right along the strip runs clockwise on the top arc and
+    # anticlockwise on the bottom arc, so both read upright.
+    direction = -1 if bottom else 1
+    slice_w = 6
+    for x0 in range(0, w, slice_w):
+        piece = strip.crop((x0, 0, min(x0 + slice_w, w), h))
+        offset = (x0 + piece.width / 2 - w / 2) / arc_r  # radians from mid
+        angle = mid_angle + direction * offset
+        piece = piece.rotate(-direction * math.degrees(offset), resample=Image.BICUBIC, expand=True)
+        x = CENTER + arc_r * math.cos(angle)
+        y = CENTER + arc_r * math.sin(angle)
+        img.paste(piece, (round(x - piece.width / 2), round(y - piece.height / 2)), piece)
+
+draw_arc_text("छत्तीसगढ़", -math.pi/2)
+draw_arc_text("शासन", math.pi/2, bottom=True)
+
+# Save flattened onto white: the notice is printed on white paper anyway,
+# and an opaque PNG is embedded as-is instead of being split into colour
+# and alpha planes on every notice.
+page = Image.new('RGB', img.size, WHITE)
+page.paste(img, mask=img.getchannel('A'))
+page.save(out_path, 'PNG')
 print(f"Emblem saved: {out_path} ({os.path.getsize(out_path)} bytes)")
@@ -0,0 +1,49 @@
+"""
+Subset the Devanagari font for the gazette PDF.
+Writes fonts/hindi_subset.ttf (+ bold) holding only the glyphs that the
+Hindi page of create_notice can use:
+- every Devanagari string literal in app.py
+- printable ASCII for plot IDs, amounts and dates
+Needs fontTools (pip install fonttools). Re-run after editing Hindi text.
+"""
+from fontTools.subset import Options, Subsetter
+from fontTools.ttLib import TTFont
+import ast, os, sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+from app import FONT_DIR, HINDI_SUBSET, HINDI_FONT_PAIRS
+
+# === GLYPHS USED BY THE NOTICE ===
+with open(os.path.join(BASE_DIR, 'app.py'), encoding='utf-8') as f:
+    tree = ast.parse(f.read())
+text = set(chr(c) for c in range(0x20, 0x7F))
+for node in ast.walk(tree):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        if any('\u0900' <= ch <= '\u097F' for ch in node.value):
+            text.update(node.value)
+text.discard('\n')
+text = ''.join(sorted(text))
+
+# === SOURCE FONT ===
+source = next(((reg, bold) for reg, bold in HINDI_FONT_PAIRS if os.path.exists(reg)), None)
+if source is None:
+    print("No Devanagari system font found; nothing to subset.")
+    sys.exit(1)
+
+# Keep every OpenType layout feature so conjuncts and matras still shape
+options = Options()
+options.layout_features = ['*']
+options.name_IDs = ['*']
+options.notdef_outline = True
+
+os.makedirs(FONT_DIR, exist_ok=True)
+for src, out_path in zip(source, HINDI_SUBSET):
+    if not os.path.exists(src):
+        src = source[0]
+    font = TTFont(src, fontNumber=0)
+    subsetter = Subsetter(options=options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    font.save(out_path)
+    print(f"Subset {src} -> {out_path} ({os.path.getsize(out_path) // 1024} KB, {len(text)} chars)")
@@ -1,8 +1,8 @@
-import requests
+import aiohttp  # pip install -r requirements-dev.txt
+import argparse
+import asyncio
 import json
-
-# The URL of your local server
-url = 'http://127.0.0.1:5000/analyze_plot'
+import time
 
 # Test Case: A generic plot in Raipur (Coordinates for a park/open area)
 # NOTE: GeoJSON uses [Longitude, Latitude]
@@ -19,16 +19,39 @@ payload = {
     ]
 }
 
-try:
-    print(f"📡 Sending coordinates to {url}...")
-    response = requests.post(url, json=payload)
-    
-    if response.status_code == 200:
-        print("\n✅ SUCCESS! Server Responded:")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"\n❌ Server Error: {response.status_code}")
-        print(response.text)
-
-except Exception as e:
-    print(f"\n❌ Connection Refused. Is the server running? Error: {e}")
\ No newline at end of file
+
+async def post(session, url):
+    async with session.post(url, json=payload) as response:
+        return response.status, await response.text()
+
+
+async def run(url, concurrency):
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[post(session, url) for _ in range(concurrency)])
+        return results, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Analyze a test plot against a running server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000/analyze_plot')  # The URL of your local server
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help="number of requests sent at once")
+    args = parser.parse_args()
+
+    try:
+        print(f"📡 Sending coordinates to {args.url} ({args.concurrency} at once)...")
+        results, elapsed = asyncio.run(run(args.url, args.concurrency))
+        status, text = next(((s, t) for s, t in results if s != 200), results[0])
+
+        if status == 200:
+            print(f"\n✅ SUCCESS! {len(results)} response(s) in {elapsed:.2f}s "
+                  f"({len(results) / elapsed:.1f} req/s). Server Responded:")
+            print(json.dumps(json.loads(text), indent=2))
+        else:
+            print(f"\n❌ Server Error: {status} "
+                  f"({sum(s != 200 for s, _ in results)}/{len(results)} failed)")
+            print(text)
+
+    except Exception as e:
+        print(f"\n❌ Connection Refused. Is the server running? Error: {e}")
@@ -1,19 +1,46 @@
-import requests
+import aiohttp  # pip install -r requirements-dev.txt
+import argparse
+import asyncio
 import json
-
-url = 'http://127.0.0.1:5000/generate_notice'
+import time
 
 payload = {
     "plot_id": "PLOT-TEST-001",
     "violation": "UNAUTHORIZED CONCRETE STRUCTURE DETECTED (High Radar Return)"
 }
 
-print(f"🔨 Generating Legal Notice at {url}...")
-response = requests.post(url, json=payload)
 
-if response.status_code == 200:
-    print("\n✅ NOTICE GENERATED!")
-    print(json.dumps(response.json(), indent=2))
-    print("\n👉 Check your LandGuard_Backend folder. There should be a PDF there now.")
-else:
-    print(f"\n❌ Error: {response.text}")
\ No newline at end of file
+async def post(session, url, i):
+    # A distinct plot ID per request, so each one renders instead of hitting the PDF cache
+    body = dict(payload, plot_id=f"PLOT-TEST-{i + 1:03d}")
+    async with session.post(url, json=body) as response:
+        return response.status, await response.text()
+
+
+async def run(url, concurrency):
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[post(session, url, i) for i in range(concurrency)])
+        return results, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate legal notices against a running server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000/generate_notice')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help="number of notices requested at once")
+    args = parser.parse_args()
+
+    print(f"🔨 Generating {args.concurrency} Legal Notice(s) at {args.url}...")
+    results, elapsed = asyncio.run(run(args.url, args.concurrency))
+    ok = [text for status, text in results if status == 200]
+
+    if ok:
+        print(f"\n✅ {len(ok)}/{len(results)} NOTICES GENERATED in {elapsed:.2f}s "
+              f"({len(results) / elapsed:.1f} req/s)")
+        print(json.dumps(json.loads(ok[0]), indent=2))
+        print("\n👉 Check your LandGuard_Backend folder. There should be a PDF there now.")
+    for status, text in results:
+        if status != 200:
+            print(f"\n❌ Error: {text}")
+            break
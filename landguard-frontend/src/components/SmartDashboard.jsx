@@ -782,9 +782,10 @@ export default function SmartDashboard() {
     try {
       showNotification("⏳ Generating Legal Notice...");
 
-      // Step 1: Request PDF generation from backend with full satellite evidence
+      // Request the PDF with full satellite evidence; ?inline=1 returns the
+      // file itself, so no second round-trip to /download is needed
       const analysisData = selectedPlot.analysis_data;
-      const response = await axios.post(`${API_BASE}/generate_notice`, {
+      const response = await axios.post(`${API_BASE}/generate_notice?inline=1`, {
         plot_id: selectedPlot.plot_id,
         violation: selectedPlot.description,
         excess_area_sqm: analysisData?.area?.excess_area_sqm || 0,
@@ -798,21 +799,21 @@ export default function SmartDashboard() {
         timeline_data: timelineData.length > 0
           ? timelineData.map(t => ({ date: t.date, encroached_area: t.area }))
           : null,
-      });
+      }, { responseType: 'blob' });
 
-      const { file, download_link } = response.data;
-      const downloadUrl = `${API_BASE}${download_link}`;
-      const fileName = file || 'LegalNotice.pdf';
+      const disposition = response.headers['content-disposition'] || '';
+      const fileName = disposition.match(/filename="?([^";]+)"?/)?.[1] || 'LegalNotice.pdf';
 
+      // The PDF came inline, so there is no /download link to keep (the
+      // server may not archive it at all); the file name identifies it
       setGeneratedReports(prev => [{
         id: selectedPlot.plot_id,
         date: new Date().toLocaleDateString(),
-        download: downloadUrl
+        file: fileName
       }, ...prev]);
 
-      // Step 2: Download the PDF as a blob and trigger browser save
-      const pdfRes = await axios.get(downloadUrl, { responseType: 'blob' });
-      const blob = new Blob([pdfRes.data], { type: 'application/pdf' });
+      // Trigger browser save
+      const blob = new Blob([response.data], { type: 'application/pdf' });
       const blobUrl = window.URL.createObjectURL(blob);
       const link = document.createElement('a');
       link.href = blobUrl;